@@ -0,0 +1,98 @@
+"""
+Graph Math Helpers
+
+Small NumPy helpers for the edge bookkeeping done while building scenes.
+Edges are undirected (u, v) tuples. The edge-list helpers take vertices
+0..n-1 and return plain-int tuples in itertools.combinations order, so they
+can be passed straight to Manim's Graph; the matrix helpers take labelled
+vertices and return int arrays ready for IntegerMatrix via .tolist(), and
+adjacency_lists returns plain Python lists keyed by vertex.
+"""
+
+import numpy as np
+
+
+def adjacency_mask(n, edges):
+    """
+    Build a symmetric boolean adjacency matrix.
+
+    Args:
+        n: Number of vertices
+        edges: Iterable of (u, v) pairs with 0 <= u, v < n
+
+    Returns:
+        (n, n) bool array, True where an edge exists in either direction
+    """
+    mask = np.zeros((n, n), dtype=bool)
+    uv = np.asarray(list(edges), dtype=np.intp).reshape(-1, 2)
+    mask[uv[:, 0], uv[:, 1]] = True
+    mask[uv[:, 1], uv[:, 0]] = True
+    return mask
+
+
+def complement_edges(n, edges):
+    """
+    List the vertex pairs that are not joined by any of the given edges.
+
+    Args:
+        n: Number of vertices
+        edges: Iterable of (u, v) pairs, in either orientation
+
+    Returns:
+        List of (u, v) tuples with u < v, in itertools.combinations order
+    """
+    rows, cols = np.triu_indices(n, k=1)
+    missing = ~adjacency_mask(n, edges)[rows, cols]
+    return list(zip(rows[missing].tolist(), cols[missing].tolist()))
+
+
+def incidence_matrix(vertices, edges):
+    """
+    Build the vertex/edge incidence matrix.
+
+    Args:
+        vertices: Vertex labels, in row order
+        edges: (u, v) pairs, in column order
+
+    Returns:
+        (len(vertices), len(edges)) int array, 1 where the vertex is an endpoint
+    """
+    v_arr = np.asarray(vertices)
+    e_arr = np.asarray(edges).reshape(-1, 2)
+    return ((e_arr[:, 0] == v_arr[:, None]) | (e_arr[:, 1] == v_arr[:, None])).astype(int)
+
+
+def adjacency_matrix(vertices, edges):
+    """
+    Build the symmetric 0/1 adjacency matrix, without self-loops.
+
+    Args:
+        vertices: Vertex labels, in row/column order
+        edges: (u, v) pairs, in either orientation
+
+    Returns:
+        (len(vertices), len(vertices)) int array
+    """
+    index = {v: i for i, v in enumerate(vertices)}
+    adj = adjacency_mask(len(vertices), [(index[u], index[v]) for u, v in edges]).astype(int)
+    np.fill_diagonal(adj, 0)
+    return adj
+
+
+def adjacency_lists(vertices, edges):
+    """
+    Build sorted neighbour lists for every vertex.
+
+    Args:
+        vertices: Vertex labels
+        edges: (u, v) pairs, in either orientation
+
+    Returns:
+        Dict mapping each vertex to its ascending list of neighbours
+    """
+    e_arr = np.asarray(edges).reshape(-1, 2)
+    both = np.concatenate([e_arr, e_arr[:, ::-1]])
+    both = both[np.lexsort((both[:, 1], both[:, 0]))]
+    starts = np.searchsorted(both[:, 0], vertices)
+    ends = np.searchsorted(both[:, 0], vertices, side="right")
+    return {v: both[s:e, 1].tolist() for v, s, e in zip(vertices, starts, ends)}
@@ -11,9 +11,80 @@ The visualization includes:
 - Dirac's Theorem demonstration
 - Backtracking algorithm with stack visualization
 - Multiple example graphs
+
+The scene is play-heavy; for faster renders use Manim's OpenGL renderer:
+
+    manim -qm --renderer=opengl --write_to_movie src/hamiltonian_path.py HamiltonConcepts
 """
 
-from manim import *
+from manim import (
+    BLACK,
+    BLUE,
+    BLUE_D,
+    DL,
+    DOWN,
+    GREEN,
+    GREEN_D,
+    LEFT,
+    ORANGE,
+    ORIGIN,
+    RED,
+    RIGHT,
+    UP,
+    WHITE,
+    YELLOW,
+    AnimationGroup,
+    Create,
+    Dot,
+    FadeIn,
+    FadeOut,
+    Graph,
+    Group,
+    ImageMobject,
+    MathTex,
+    Rectangle,
+    Scene,
+    Succession,
+    Text,
+    Transform,
+    VGroup,
+    Wait,
+    Write,
+)
+import os
+
+from tex_cache import mathtex_proto
+
+
+EDGE_WIDTH = 3
+VERTEX_STYLE = {
+    "radius": 0.14,
+    "fill_color": WHITE,
+    "stroke_color": WHITE,
+    "stroke_width": 2,
+}
+EDGE_STYLE = {
+    "stroke_color": WHITE,
+    "stroke_width": EDGE_WIDTH,
+}
+# Hexagon layout shared by the Ore and Dirac theorem graphs
+HEX_LAYOUT = {
+    1: LEFT * 3 + UP * 1.8,
+    2: LEFT * 1 + UP * 2.4,
+    3: RIGHT * 1 + UP * 2.4,
+    4: RIGHT * 3 + UP * 1.8,
+    5: RIGHT * 2 + DOWN * 1.8,
+    6: LEFT * 2 + DOWN * 1.8,
+}
+# Prototype for path-stack entries; copied on every push instead of rebuilt
+STACK_ITEM_TEMPLATE = Rectangle(
+    width=1.9,
+    height=0.4,
+    stroke_color=BLUE,
+    stroke_width=1.5,
+    fill_color=BLUE,
+    fill_opacity=0.3,
+)
 
 
 class HamiltonConcepts(Scene):
@@ -25,77 +96,68 @@ class HamiltonConcepts(Scene):
     demonstrates theorems that guarantee Hamiltonian cycles and algorithms
     for finding them.
     """
-    
-    def construct(self):
-        edge_width = 3
-        vertex_style = {
-            "radius": 0.14,
-            "fill_color": WHITE,
-            "stroke_color": WHITE,
-            "stroke_width": 2,
-        }
-        edge_style = {
-            "stroke_color": WHITE,
-            "stroke_width": edge_width,
-        }
 
-        def animate_path(graph, path_vertices, color=YELLOW, close_cycle=False):
-            """
-            Animate a Hamiltonian path or cycle through the graph.
-            
-            Visualizes the path by moving a dot along edges and highlighting
-            them in sequence. Optionally closes the cycle by returning to start.
-            
-            Args:
-                graph: The Manim Graph object to traverse
-                path_vertices: List of vertices in path order
-                color: Color for highlighting the path (default: YELLOW)
-                close_cycle: If True, add edge from last to first vertex (default: False)
-            """
-            if len(path_vertices) < 2:
-                return
+    # Idle time between backtracking steps; the step animations carry most of the pacing
+    PAUSE = 0.35
+
+    def animate_path(self, graph, path_vertices, color=YELLOW, close_cycle=False):
+        """
+        Animate a Hamiltonian path or cycle through the graph.
+        
+        Visualizes the path by moving a dot along edges and highlighting
+        them in sequence. Optionally closes the cycle by returning to start.
+        
+        Args:
+            graph: The Manim Graph object to traverse
+            path_vertices: List of vertices in path order
+            color: Color for highlighting the path (default: YELLOW)
+            close_cycle: If True, add edge from last to first vertex (default: False)
+        """
+        if len(path_vertices) < 2:
+            return
 
-            # Optionally close the cycle by returning to the start
-            if close_cycle and path_vertices[0] != path_vertices[-1]:
-                path_vertices = list(path_vertices) + [path_vertices[0]]
-
-            dot = Dot(radius=0.12, color=color)
-            dot.move_to(graph.vertices[path_vertices[0]].get_center())
-            self.add(dot)
-
-            edges_used = []
-            for i in range(len(path_vertices) - 1):
-                u = path_vertices[i]
-                v = path_vertices[i + 1]
-                # undirected edges stored as sorted tuples
-                key = (u, v) if (u, v) in graph.edges else (v, u)
-                if key not in graph.edges:
-                    continue
+        # Optionally close the cycle by returning to the start
+        if close_cycle and path_vertices[0] != path_vertices[-1]:
+            path_vertices = list(path_vertices) + [path_vertices[0]]
+
+        centers = {v: graph.vertices[v].get_center() for v in set(path_vertices)}
+
+        dot = Dot(radius=0.12, color=color)
+        dot.move_to(centers[path_vertices[0]])
+        self.add(dot)
+
+        # undirected edges may be stored as (u, v) or (v, u)
+        key_map = {frozenset(e): e for e in graph.edges}
+        edges_used = []
+        seen = set()
+        for i in range(len(path_vertices) - 1):
+            u = path_vertices[i]
+            v = path_vertices[i + 1]
+            key = key_map.get(frozenset((u, v)))
+            if key is None:
+                continue
+            if key not in seen:
+                seen.add(key)
                 edges_used.append(key)
-                target = graph.vertices[v].get_center()
-                self.play(dot.animate.move_to(target), run_time=0.7)
-
-            # highlight edges
-            uniq_edges = list(dict.fromkeys(edges_used))
-            if uniq_edges:
-                self.play(
-                    *[
-                        graph.edges[e].animate.set_stroke(color=color, width=edge_width + 1)
-                        for e in uniq_edges
-                    ],
-                    run_time=1.5,
-                )
-                self.wait(1)
-                self.play(
-                    *[
-                        graph.edges[e].animate.set_stroke(WHITE, width=edge_width)
-                        for e in uniq_edges
-                    ],
-                    run_time=1.0,
-                )
+            self.play(dot.animate.move_to(centers[v]), run_time=0.7)
 
-            self.play(FadeOut(dot), run_time=0.4)
+        # highlight edges
+        if edges_used:
+            edge_group = VGroup(*[graph.edges[e] for e in edges_used])
+            self.play(
+                edge_group.animate.set_stroke(color=color, width=EDGE_WIDTH + 1),
+                run_time=1.5,
+            )
+            self.wait(1)
+            self.play(
+                edge_group.animate.set_stroke(WHITE, width=EDGE_WIDTH),
+                run_time=1.0,
+            )
+
+        self.play(FadeOut(dot), run_time=0.4)
 
+    def build_base_graph(self):
+        """Build the hexagon-with-chords graph shared by the path/cycle sections."""
         # ============================================================
         # Configuration: Base Graph Structure
         # Define a reusable Hamiltonian graph (hexagon with chords) for demonstrations
@@ -121,22 +183,25 @@ class HamiltonConcepts(Scene):
             6: LEFT * 2 + DOWN * 1.8,
         }
 
-        base_graph = Graph(
+        self.base_graph = Graph(
             vertices,
             edges,
             layout=layout,
-            vertex_config=vertex_style,
-            edge_config=edge_style,
+            vertex_config=VERTEX_STYLE,
+            edge_config=EDGE_STYLE,
         )
-        base_graph.scale(0.95)
+        self.base_graph.scale(0.95)
+        self.key_map = {frozenset(e): e for e in self.base_graph.edges}
         
         # Add node labels to base_graph
-        base_labels = VGroup()
+        self.base_labels = VGroup()
         for v in vertices:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(base_graph.vertices[v].get_center())
-            base_labels.add(label)
+            label = mathtex_proto(str(v), 20, BLACK).copy()
+            label.move_to(self.base_graph.vertices[v].get_center())
+            self.base_labels.add(label)
 
+    def intro(self):
+        """Show the opening title."""
         # ============================================================
         # Section 1: Introduction
         # Display the main title introducing Hamiltonian paths and cycles
@@ -146,18 +211,19 @@ class HamiltonConcepts(Scene):
         self.wait(1)
         self.play(FadeOut(intro_title, shift=UP * 0.5), run_time=0.8)
 
+    def hamilton_path(self):
+        """Demonstrate a Hamilton path on the base graph."""
         # ============================================================
         # Section 2: Hamilton Path
         # Demonstrate a Hamilton path (visits every vertex exactly once)
         # ============================================================
-        title = Text("Hamilton Path", font_size=40).to_edge(UP)
-        desc = MathTex(
-            r"\text{Visits every vertex exactly once,}",
-            r"\text{ does not return to the start.}",
+        self.title = Text("Hamilton Path", font_size=40).to_edge(UP)
+        desc = Text(
+            "Visits every vertex exactly once, does not return to the start.",
             font_size=28,
-        ).next_to(title, DOWN, buff=0.3)
+        ).next_to(self.title, DOWN, buff=0.3)
 
-        self.play(Create(base_graph), Write(base_labels), Write(title), run_time=1.5)
+        self.play(Create(self.base_graph), Write(self.base_labels), Write(self.title), run_time=1.5)
         self.play(Write(desc), run_time=1.2)
         self.wait(1)
 
@@ -169,23 +235,24 @@ class HamiltonConcepts(Scene):
         self.play(Write(path_label), run_time=1.0)
         self.wait(1)
 
-        animate_path(base_graph, ham_path, color=YELLOW, close_cycle=False)
+        self.animate_path(self.base_graph, ham_path, color=YELLOW, close_cycle=False)
         self.wait(1)
 
         self.play(FadeOut(desc), FadeOut(path_label), run_time=0.8)
 
+    def hamilton_cycle(self):
+        """Demonstrate a Hamilton cycle on the base graph."""
         # ============================================================
         # Section 3: Hamilton Cycle
         # Demonstrate a Hamilton cycle (Hamilton path that returns to start)
         # ============================================================
         title_cycle = Text("Hamilton Cycle", font_size=40).to_edge(UP)
-        desc_cycle = MathTex(
-            r"\text{Visits every vertex exactly once}",
-            r"\text{ and returns to the start.}",
+        desc_cycle = Text(
+            "Visits every vertex exactly once and returns to the start.",
             font_size=28,
         ).next_to(title_cycle, DOWN, buff=0.3)
 
-        self.play(Transform(title, title_cycle), Write(desc_cycle), run_time=1.5)
+        self.play(Transform(self.title, title_cycle), Write(desc_cycle), run_time=1.5)
         self.wait(1)
 
         ham_cycle = [1, 2, 3, 4, 5, 6]  # will be closed back to 1
@@ -196,65 +263,65 @@ class HamiltonConcepts(Scene):
         self.play(Write(cycle_label), run_time=1.0)
         self.wait(1)
 
-        animate_path(base_graph, ham_cycle, color=ORANGE, close_cycle=True)
+        self.animate_path(self.base_graph, ham_cycle, color=ORANGE, close_cycle=True)
         self.wait(1)
 
         self.play(FadeOut(desc_cycle), FadeOut(cycle_label), run_time=0.8)
 
+    def hamiltonian_graph(self):
+        """Highlight the Hamilton cycle to show the base graph is Hamiltonian."""
         # ============================================================
         # Prompt 11: Hamiltonian Graph
         # ============================================================
         title_hg = Text("Hamiltonian Graph", font_size=40).to_edge(UP)
-        self.play(Transform(title, title_hg), run_time=1.0)
+        self.play(Transform(self.title, title_hg), run_time=1.0)
 
-        hg_text = MathTex(
-            r"\text{This graph is Hamiltonian:}",
-            r"\text{ it has a Hamilton path and a Hamilton cycle.}",
+        hg_text = Text(
+            "This graph is Hamiltonian: it has a Hamilton path and a Hamilton cycle.",
             font_size=28,
         ).next_to(title_hg, DOWN, buff=0.3)
         self.play(Write(hg_text), run_time=1.0)
 
         # briefly highlight the Hamilton cycle again
         cycle_edges = [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (1, 6)]
+        # resolve the edge mobjects once; reused for the set and reset animations
+        cycle_edge_mobs = VGroup(
+            *[self.base_graph.edges[self.key_map[frozenset(e)]] for e in cycle_edges]
+        )
         self.play(
-            *[
-                base_graph.edges[
-                    (u, v) if (u, v) in base_graph.edges else (v, u)
-                ].animate.set_stroke(GREEN, width=edge_width + 1)
-                for (u, v) in cycle_edges
-            ],
+            cycle_edge_mobs.animate.set_stroke(GREEN, width=EDGE_WIDTH + 1),
             run_time=1.5,
         )
         self.wait(1)
         self.play(
-            *[
-                base_graph.edges[
-                    (u, v) if (u, v) in base_graph.edges else (v, u)
-                ].animate.set_stroke(WHITE, width=edge_width)
-                for (u, v) in cycle_edges
-            ],
+            cycle_edge_mobs.animate.set_stroke(WHITE, width=EDGE_WIDTH),
             run_time=1.0,
         )
         self.wait(1)
 
-        self.play(FadeOut(base_graph), FadeOut(base_labels), FadeOut(title), FadeOut(hg_text), run_time=1.0)
+        self.play(FadeOut(self.base_graph), FadeOut(self.base_labels), FadeOut(self.title), FadeOut(hg_text), run_time=1.0)
         self.wait(1)
 
+    def shelby(self):
+        """Show the shelby image (or a placeholder) before Ore's theorem."""
         # Add shelby.jpg image before Ore's theorem
-        try:
-            shelby_img = ImageMobject("assets/shelby.jpg")
+        shelby_path = os.path.join("assets", "shelby.jpg")
+        if os.path.exists(shelby_path):
+            shelby_img = ImageMobject(shelby_path)
             shelby_img.scale(1.5)
             shelby_img.move_to(ORIGIN)
             self.play(FadeIn(shelby_img), run_time=1.5)
             self.wait(2)
             self.play(FadeOut(shelby_img), run_time=1.0)
-        except:
+        else:
             # If image not found, show a placeholder text
             shelby_text = Text("🖼️ SHELBY 🖼️", font_size=64, color=YELLOW)
             self.play(FadeIn(shelby_text), run_time=1.5)
             self.wait(2)
             self.play(FadeOut(shelby_text), run_time=1.0)
 
+    def ore(self):
+        """Demonstrate Ore's theorem on K6 minus an edge."""
         # ============================================================
         # Section 5: Ore's Theorem
         # Demonstrate Ore's theorem: if deg(u) + deg(v) >= n for all
@@ -279,28 +346,19 @@ class HamiltonConcepts(Scene):
             (5, 6),
         ]  # complete graph except missing (1,4)
 
-        ore_layout = {
-            1: LEFT * 3 + UP * 1.8,
-            2: LEFT * 1 + UP * 2.4,
-            3: RIGHT * 1 + UP * 2.4,
-            4: RIGHT * 3 + UP * 1.8,
-            5: RIGHT * 2 + DOWN * 1.8,
-            6: LEFT * 2 + DOWN * 1.8,
-        }
-
         ore_graph = Graph(
             ore_vertices,
             ore_edges,
-            layout=ore_layout,
-            vertex_config=vertex_style,
-            edge_config=edge_style,
+            layout=HEX_LAYOUT,
+            vertex_config=VERTEX_STYLE,
+            edge_config=EDGE_STYLE,
         )
         ore_graph.scale(0.9)
         
         # Add node labels to ore_graph
         ore_labels = VGroup()
         for v in ore_vertices:
-            label = MathTex(str(v), font_size=20, color=BLACK)
+            label = mathtex_proto(str(v), 20, BLACK).copy()
             label.move_to(ore_graph.vertices[v].get_center())
             ore_labels.add(label)
 
@@ -324,9 +382,9 @@ class HamiltonConcepts(Scene):
         )
         self.play(FadeIn(pair_circle, scale=1.2), run_time=0.8)
 
-        ore_text_pair = MathTex(
-            rf"\deg({u}) = {deg[u]},\ \deg({v}) = {deg[v]},\ "
-            rf"\deg({u}) + \deg({v}) = {deg[u] + deg[v]} \ge n = 6",
+        ore_text_pair = Text(
+            f"deg({u}) = {deg[u]},  deg({v}) = {deg[v]},  "
+            f"deg({u}) + deg({v}) = {deg[u] + deg[v]} ≥ n = 6",
             font_size=26,
         ).to_corner(DL)
         self.play(Write(ore_text_pair), run_time=1.0)
@@ -345,6 +403,8 @@ class HamiltonConcepts(Scene):
         )
         self.wait(1)
 
+    def dirac(self):
+        """Demonstrate Dirac's theorem with per-vertex degree highlights."""
         # ============================================================
         # Section 6: Dirac's Theorem
         # Demonstrate Dirac's theorem: if every vertex has degree >= n/2,
@@ -364,20 +424,19 @@ class HamiltonConcepts(Scene):
             (5, 6),
         ]
 
-        dirac_layout = ore_layout  # reuse hex layout
         dirac_graph = Graph(
             dirac_vertices,
             dirac_edges,
-            layout=dirac_layout,
-            vertex_config=vertex_style,
-            edge_config=edge_style,
+            layout=HEX_LAYOUT,
+            vertex_config=VERTEX_STYLE,
+            edge_config=EDGE_STYLE,
         )
         dirac_graph.scale(0.9)
         
         # Add node labels to dirac_graph
         dirac_labels = VGroup()
         for v in dirac_vertices:
-            label = MathTex(str(v), font_size=20, color=BLACK)
+            label = mathtex_proto(str(v), 20, BLACK).copy()
             label.move_to(dirac_graph.vertices[v].get_center())
             dirac_labels.add(label)
 
@@ -392,7 +451,12 @@ class HamiltonConcepts(Scene):
         self.play(Write(desc_dirac), run_time=1.2)
         self.wait(1)
 
-        deg_d = {x: sum(1 for e in dirac_edges if x in e) for x in dirac_vertices}
+        # Single pass over the edges: incident edges per vertex
+        incidence = {x: [] for x in dirac_vertices}
+        for e in dirac_edges:
+            for x in e:
+                incidence[x].append(e)
+        deg_d = {x: len(incidence[x]) for x in dirac_vertices}
         n = len(dirac_vertices)
         min_deg = min(deg_d.values())
 
@@ -404,28 +468,26 @@ class HamiltonConcepts(Scene):
         self.play(Write(deg_text_dirac), run_time=1.0)
         self.wait(1)
 
-        # highlight all vertices once to show degrees
+        # highlight all vertices once to show degrees (single play call)
+        degree_anims = []
         for vtx in dirac_vertices:
-            incident = [e for e in dirac_edges if vtx in e]
-            self.play(
-                dirac_graph.vertices[vtx].animate.set_fill(YELLOW),
-                *[
-                    dirac_graph.edges[e].animate.set_stroke(
-                        YELLOW, width=edge_width + 1
-                    )
-                    for e in incident
-                ],
-                run_time=0.8,
+            incident_group = VGroup(*[dirac_graph.edges[e] for e in incidence[vtx]])
+            degree_anims.append(
+                AnimationGroup(
+                    dirac_graph.vertices[vtx].animate.set_fill(YELLOW),
+                    incident_group.animate.set_stroke(YELLOW, width=EDGE_WIDTH + 1),
+                    run_time=0.8,
+                )
             )
-            self.wait(1)
-            self.play(
-                dirac_graph.vertices[vtx].animate.set_fill(WHITE),
-                *[
-                    dirac_graph.edges[e].animate.set_stroke(WHITE, width=edge_width)
-                    for e in incident
-                ],
-                run_time=0.6,
+            degree_anims.append(Wait(1))
+            degree_anims.append(
+                AnimationGroup(
+                    dirac_graph.vertices[vtx].animate.set_fill(WHITE),
+                    incident_group.animate.set_stroke(WHITE, width=EDGE_WIDTH),
+                    run_time=0.6,
+                )
             )
+        self.play(Succession(*degree_anims))
 
         self.wait(1)
 
@@ -439,6 +501,8 @@ class HamiltonConcepts(Scene):
         )
         self.wait(1)
 
+    def algorithm_types(self):
+        """Compare backtracking and heuristic approaches."""
         # ============================================================
         # Section 7: Algorithm Types Comparison
         # Compare backtracking (systematic) vs heuristics (greedy) approaches
@@ -490,6 +554,10 @@ class HamiltonConcepts(Scene):
         )
         self.wait(1)
 
+    def backtracking_demo(self):
+        """Explain and step through the backtracking search for a Hamiltonian cycle."""
+        EW1, EW2, EW3 = EDGE_WIDTH + 1, EDGE_WIDTH + 2, EDGE_WIDTH + 3
+
         # ============================================================
         # Section 8: Backtracking Algorithm Visualization
         # Demonstrate the backtracking algorithm for finding Hamiltonian cycles
@@ -518,8 +586,8 @@ class HamiltonConcepts(Scene):
             v_alg,
             e_alg,
             layout=lay_alg,
-            vertex_config=vertex_style,
-            edge_config=edge_style,
+            vertex_config=VERTEX_STYLE,
+            edge_config=EDGE_STYLE,
         )
         alg_graph.scale(0.9)
 
@@ -531,12 +599,12 @@ class HamiltonConcepts(Scene):
         self.play(Write(backtrack_algo_title), run_time=1.2)
         
         backtrack_algo_text = VGroup(
-            MathTex(r"\text{1. Start with initial vertex in path.}", font_size=24),
-            MathTex(r"\text{2. Try adding an unvisited neighbor to path.}", font_size=24),
-            MathTex(r"\text{3. If path includes all vertices and forms cycle: success!}", font_size=24),
-            MathTex(r"\text{4. If dead end reached: backtrack (remove last vertex).}", font_size=24),
-            MathTex(r"\text{5. Try next unvisited neighbor.}", font_size=24),
-            MathTex(r"\text{6. Repeat until cycle found or all possibilities exhausted.}", font_size=24),
+            Text("1. Start with initial vertex in path.", font_size=24),
+            Text("2. Try adding an unvisited neighbor to path.", font_size=24),
+            Text("3. If path includes all vertices and forms cycle: success!", font_size=24),
+            Text("4. If dead end reached: backtrack (remove last vertex).", font_size=24),
+            Text("5. Try next unvisited neighbor.", font_size=24),
+            Text("6. Repeat until cycle found or all possibilities exhausted.", font_size=24),
         ).arrange(DOWN, buff=0.25, aligned_edge=LEFT)
         backtrack_algo_text.next_to(backtrack_algo_title, DOWN, buff=0.4)
         self.play(Write(backtrack_algo_text), run_time=3.75)
@@ -548,20 +616,21 @@ class HamiltonConcepts(Scene):
         )
 
         # Add node labels like in dfs.py
-        alg_node_labels = VGroup()
-        label_dict = {}  # Map vertex number to label mobject
-        for v in v_alg:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(alg_graph.vertices[v].get_center())
-            alg_node_labels.add(label)
-            label_dict[v] = label
+        labels = [
+            mathtex_proto(str(v), 20, BLACK).copy().move_to(
+                alg_graph.vertices[v].get_center()
+            )
+            for v in v_alg
+        ]
+        alg_node_labels = VGroup(*labels)
+        label_dict = dict(zip(v_alg, labels))  # Map vertex number to label mobject
 
         title_bt = Text("Backtracking for Hamiltonian Cycle", font_size=34).to_edge(UP)
         self.play(Create(alg_graph), Write(alg_node_labels), Write(title_bt), run_time=1.5)
         self.wait(1)
 
         # Stack visualization setup - matching dfs.py style
-        stack_label = MathTex(r"\text{Path Stack}", font_size=22)
+        stack_label = Text("Path Stack", font_size=22)
         stack_label.to_edge(LEFT, buff=0.4).shift(UP * 1.8)
         
         stack_container = Rectangle(
@@ -593,7 +662,7 @@ class HamiltonConcepts(Scene):
         self.wait(1)
 
         # Visited set visualization
-        visited_label = MathTex(r"\text{Visited:}", font_size=18)
+        visited_label = Text("Visited:", font_size=18)
         visited_label.next_to(stack_container, DOWN, buff=0.3)
         visited_label.align_to(stack_label, LEFT)
         
@@ -601,9 +670,7 @@ class HamiltonConcepts(Scene):
         self.wait(1)
 
         # Status text at bottom
-        status_text = MathTex(
-            r"\text{Status:}", font_size=20
-        ).to_edge(DOWN, buff=0.3).shift(LEFT * 2)
+        status_text = Text("Status:", font_size=20).to_edge(DOWN, buff=0.3).shift(LEFT * 2)
         
         self.play(Write(status_text), run_time=0.5)
         self.wait(1)
@@ -627,55 +694,77 @@ class HamiltonConcepts(Scene):
             run_time=1.0,
         )
         
+        # Pre-allocate the path-stack entries; pushes take one from the free
+        # list and pops hand it back, so no new mobjects are built per push
+        stack_digits = {v: mathtex_proto(str(v), 16, WHITE) for v in v_alg}
+        stack_pool_free = [
+            VGroup(STACK_ITEM_TEMPLATE.copy(), stack_digits[start_v].copy())
+            for _ in range(len(v_alg) + 1)
+        ]
+
         # Add starting vertex to the path stack
-        stack_item = Rectangle(
-            width=1.9,
-            height=0.4,
-            stroke_color=BLUE,
-            stroke_width=1.5,
-            fill_color=BLUE,
-            fill_opacity=0.3,
-        )
-        stack_text = MathTex(str(start_v), font_size=16, color=WHITE)
-        stack_text.move_to(stack_item.get_center())
-        stack_item_group = VGroup(stack_item, stack_text)
+        stack_item_group = stack_pool_free.pop()
+        stack_item, stack_text = stack_item_group
+        stack_text.become(stack_digits[start_v]).move_to(stack_item.get_center())
         stack_item_group.next_to(stack_container.get_bottom(), UP, buff=0.15)
         stack_item_group.align_to(stack_container, LEFT).shift(RIGHT * 0.15)
         stack_items.add(stack_item_group)
-        self.add(stack_item_group)
         self.play(FadeIn(stack_item_group, shift=DOWN * 0.15), run_time=0.7)
         
         # Mark starting vertex as visited
-        visited_item = MathTex(str(start_v), font_size=16, color=BLUE)
+        visited_item = mathtex_proto(str(start_v), 16, BLUE).copy()
         visited_item.next_to(visited_label, DOWN, buff=0.2)
         visited_item.align_to(visited_label, LEFT).shift(RIGHT * 0.3)
         visited_items.add(visited_item)
-        self.add(visited_item)
         self.play(FadeIn(visited_item, scale=0.9), run_time=0.5)
+
+        # Layout cursor for the visited row: right edge of the last entry and the
+        # shared baseline, so new entries are placed without re-measuring the row
+        x_cursor = visited_item.get_right()[0]
+        y_base = visited_item.get_bottom()[1]
         
-        self.wait(1)
+        self.wait(self.PAUSE)
 
         # ============================================================
         # Helper Functions for Backtracking Visualization
         # ============================================================
+        alg_edges = alg_graph.edges
+
         # Helper: Get edge key (handles both directions for undirected graphs)
         def get_edge_key(u, v):
             key1 = (u, v)
             key2 = (v, u)
-            if key1 in alg_graph.edges:
+            if key1 in alg_edges:
                 return key1
-            elif key2 in alg_graph.edges:
+            elif key2 in alg_edges:
                 return key2
             else:
                 # Return canonical form as fallback
                 return (min(u, v), max(u, v))
 
+        # Every (u, v) step the walkthrough takes, resolved once up front
+        EKEYS = {
+            (u, v): get_edge_key(u, v)
+            for u, v in [(1, 2), (2, 3), (3, 4), (4, 5), (3, 5), (5, 4), (4, 1), (5, 1)]
+        }
+
         # Helper: Update status text with concise messages
         # Filters verbose messages to show only key algorithm states:
         # - "Exploring..." - actively searching
         # - "Dead end" - no valid continuation
         # - "Backtracking..." - removing invalid path segments
         # - "Hamiltonian cycle found" - solution discovered
+        # Each short status line is laid out once; update_status morphs into a copy
+        status_cache = {
+            display: Text(f"Status: {display}", font_size=20).move_to(status_text.get_center())
+            for display in [
+                "Exploring...",
+                "Dead end",
+                "Backtracking...",
+                "Hamiltonian cycle found",
+            ]
+        }
+
         def update_status(msg):
             # Decide which short message to show
             if "Exploring" in msg:
@@ -691,23 +780,13 @@ class HamiltonConcepts(Scene):
                 # Ignore less important / verbose messages
                 return
 
-            new_status = MathTex(rf"\text{{Status: {display}}}", font_size=20)
-            new_status.move_to(status_text.get_center())
-            self.play(Transform(status_text, new_status), run_time=0.5)
+            self.play(Transform(status_text, status_cache[display].copy()), run_time=0.5)
 
-        # Helper: Push vertex to stack with smooth animation
+        # Helper: Place the next path-stack entry; the caller plays the returned FadeIn
         def push_to_stack(vertex):
-            stack_item = Rectangle(
-                width=1.9,
-                height=0.4,
-                stroke_color=BLUE,
-                stroke_width=1.5,
-                fill_color=BLUE,
-                fill_opacity=0.3,
-            )
-            stack_text = MathTex(str(vertex), font_size=16, color=WHITE)
-            stack_text.move_to(stack_item.get_center())
-            stack_item_group = VGroup(stack_item, stack_text)
+            stack_item_group = stack_pool_free.pop()
+            stack_item, stack_text = stack_item_group
+            stack_text.become(stack_digits[vertex]).move_to(stack_item.get_center())
             if len(stack_items) == 0:
                 stack_item_group.next_to(stack_container.get_bottom(), UP, buff=0.15)
                 stack_item_group.align_to(stack_container, LEFT).shift(RIGHT * 0.15)
@@ -715,118 +794,88 @@ class HamiltonConcepts(Scene):
                 stack_item_group.next_to(stack_items[-1], UP, buff=0.08)
                 stack_item_group.align_to(stack_items[-1], LEFT)
             stack_items.add(stack_item_group)
-            self.add(stack_item_group)
-            self.play(FadeIn(stack_item_group, shift=DOWN * 0.15), run_time=0.7)
-            return stack_item_group
+            return FadeIn(stack_item_group, shift=DOWN * 0.15)
 
-        # Helper: Pop vertex from stack with smooth animation
+        # Helper: Take the top path-stack entry off; the caller plays the returned FadeOut
         def pop_from_stack():
-            if len(stack_items) > 0:
-                item_to_remove = stack_items[-1]
-                stack_items.remove(item_to_remove)
-                self.play(FadeOut(item_to_remove, shift=UP * 0.2), run_time=0.6)
-                self.remove(item_to_remove)
-                return True
-            return False
+            item_to_remove = stack_items.submobjects.pop()
+            # Back to the pool; it is only reused by a later push, after this play
+            stack_pool_free.append(item_to_remove)
+            return FadeOut(item_to_remove, shift=UP * 0.2)
+
+        # Helper: Extend the path by one edge in a single render pass
+        def step_to(prev_v, next_v):
+            nonlocal x_cursor
+            edge_key = EKEYS[(prev_v, next_v)]
+            path.append(next_v)
+            visited_set.add(next_v)
+            current_path_edges.append(edge_key)
+
+            stack_anim = push_to_stack(next_v)
+            visited_item = mathtex_proto(str(next_v), 16, BLUE).copy()
+            visited_item.move_to(
+                [
+                    x_cursor + 0.3 + visited_item.width / 2,
+                    y_base + visited_item.height / 2,
+                    0,
+                ]
+            )
+            x_cursor += 0.3 + visited_item.width
+            visited_items.add(visited_item)
+
+            self.play(
+                AnimationGroup(
+                    alg_graph.vertices[next_v].animate.set_fill(YELLOW),
+                    label_dict[next_v].animate.set_color(BLACK),
+                    alg_edges[edge_key].animate.set_stroke(ORANGE, width=EW1),
+                    stack_anim,
+                    FadeIn(visited_item, scale=0.9),
+                    lag_ratio=0.15,
+                ),
+                run_time=1.0,
+            )
+
+        # Helper: Undo the last path step (prev_v -> vertex) in a single render pass
+        def backtrack(prev_v, vertex):
+            nonlocal x_cursor
+            visited_set.remove(vertex)
+            path.pop()
+            current_path_edges.pop()
+
+            item_to_remove = visited_items.submobjects.pop()
+            x_cursor -= 0.3 + item_to_remove.width
+
+            self.play(
+                AnimationGroup(
+                    alg_edges[EKEYS[(prev_v, vertex)]].animate.set_stroke(
+                        WHITE, width=EDGE_WIDTH
+                    ),
+                    alg_graph.vertices[vertex].animate.set_fill(WHITE),
+                    label_dict[vertex].animate.set_color(BLACK),
+                    FadeOut(item_to_remove),
+                    pop_from_stack(),
+                    lag_ratio=0.15,
+                ),
+                run_time=1.0,
+            )
 
         # Begin the backtracking search process
         update_status("Exploring path...")
-        self.wait(1)
+        self.wait(self.PAUSE)
 
         # Step 1: Try 1 -> 2
-        next_v = 2
-        edge_key = get_edge_key(start_v, next_v)
-        path.append(next_v)
-        visited_set.add(next_v)
-        current_path_edges.append(edge_key)
-        
-        self.play(
-            alg_graph.vertices[next_v].animate.set_fill(YELLOW),
-            label_dict[next_v].animate.set_color(BLACK),
-            alg_graph.edges[edge_key].animate.set_stroke(ORANGE, width=edge_width + 1),
-            run_time=1.0,
-        )
-        push_to_stack(next_v)
-        visited_item = MathTex(str(next_v), font_size=16, color=BLUE)
-        if len(visited_items) > 0:
-            visited_item.next_to(visited_items[-1], RIGHT, buff=0.3)
-            visited_item.align_to(visited_items[-1], DOWN)
-        visited_items.add(visited_item)
-        self.add(visited_item)
-        self.play(FadeIn(visited_item, scale=0.9), run_time=0.5)
-        self.wait(1)
+        step_to(start_v, 2)
 
         # Step 2: Try 2 -> 3
-        prev_v = next_v
-        next_v = 3
-        edge_key = get_edge_key(prev_v, next_v)
-        path.append(next_v)
-        visited_set.add(next_v)
-        current_path_edges.append(edge_key)
-        
-        self.play(
-            alg_graph.vertices[next_v].animate.set_fill(YELLOW),
-            label_dict[next_v].animate.set_color(BLACK),
-            alg_graph.edges[edge_key].animate.set_stroke(ORANGE, width=edge_width + 1),
-            run_time=1.0,
-        )
-        push_to_stack(next_v)
-        visited_item = MathTex(str(next_v), font_size=16, color=BLUE)
-        visited_item.next_to(visited_items[-1], RIGHT, buff=0.3)
-        visited_item.align_to(visited_items[-1], DOWN)
-        visited_items.add(visited_item)
-        self.add(visited_item)
-        self.play(FadeIn(visited_item, scale=0.9), run_time=0.5)
-        self.wait(1)
+        step_to(2, 3)
 
         # Step 3: Try 3 -> 4
-        prev_v = next_v
-        next_v = 4
-        edge_key = get_edge_key(prev_v, next_v)
-        path.append(next_v)
-        visited_set.add(next_v)
-        current_path_edges.append(edge_key)
-        
-        self.play(
-            alg_graph.vertices[next_v].animate.set_fill(YELLOW),
-            label_dict[next_v].animate.set_color(BLACK),
-            alg_graph.edges[edge_key].animate.set_stroke(ORANGE, width=edge_width + 1),
-            run_time=1.0,
-        )
-        push_to_stack(next_v)
-        visited_item = MathTex(str(next_v), font_size=16, color=BLUE)
-        visited_item.next_to(visited_items[-1], RIGHT, buff=0.3)
-        visited_item.align_to(visited_items[-1], DOWN)
-        visited_items.add(visited_item)
-        self.add(visited_item)
-        self.play(FadeIn(visited_item, scale=0.9), run_time=0.5)
-        self.wait(1)
+        step_to(3, 4)
 
         # Step 4: Try 4 -> 5 (this will lead to a dead end at 5)
         update_status("At vertex 4: going to vertex 5...")
-        self.wait(1)
-        
-        prev_v = 4
-        next_v = 5
-        edge_key = get_edge_key(prev_v, next_v)
-        path.append(next_v)
-        visited_set.add(next_v)
-        current_path_edges.append(edge_key)
-        
-        self.play(
-            alg_graph.vertices[next_v].animate.set_fill(YELLOW),
-            label_dict[next_v].animate.set_color(BLACK),
-            alg_graph.edges[edge_key].animate.set_stroke(ORANGE, width=edge_width + 1),
-            run_time=1.0,
-        )
-        push_to_stack(next_v)
-        visited_item = MathTex(str(next_v), font_size=16, color=BLUE)
-        visited_item.next_to(visited_items[-1], RIGHT, buff=0.3)
-        visited_item.align_to(visited_items[-1], DOWN)
-        visited_items.add(visited_item)
-        self.add(visited_item)
-        self.play(FadeIn(visited_item, scale=0.9), run_time=0.5)
-        self.wait(1)
+
+        step_to(4, 5)
 
         # Dead End Detection: At vertex 5, all vertices are visited
         # Current path: [1, 2, 3, 4, 5], visited set: {1, 2, 3, 4, 5}
@@ -834,13 +883,12 @@ class HamiltonConcepts(Scene):
         # However, vertex 5 only connects to: 3 (already visited) and 4 (already visited)
         # Since no edge exists from 5 to 1, this path cannot form a cycle → DEAD END
         update_status("At vertex 5: checking cycle completion...")
-        self.wait(1)
         
         # Check if edge 5->1 exists
-        return_edge_key = get_edge_key(5, 1)
-        if return_edge_key not in alg_graph.edges:
+        return_edge_key = EKEYS[(5, 1)]
+        if return_edge_key not in alg_edges:
             update_status("At vertex 5: no edge to start vertex 1! Dead end.")
-            self.wait(1)
+            self.wait(self.PAUSE)
             
             # Mark vertex 5 as dead end (red)
             self.play(
@@ -848,275 +896,120 @@ class HamiltonConcepts(Scene):
                 label_dict[5].animate.set_color(WHITE),
                 run_time=0.8,
             )
-            self.wait(1)
+            self.wait(self.PAUSE)
             
-            # BACKTRACK: Pop 5 from stack and path
+            # BACKTRACK: Pop 5 from stack and path, reset edge (4,5) and vertex 5
             update_status("Backtracking: removing vertex 5 from path...")
-            self.wait(1)
-            
-            # Remove 5 from visited set
-            visited_set.remove(5)
-            path.pop()  # Remove 5 from path
-            last_edge = current_path_edges.pop()  # Remove edge (4,5)
-            
-            # Reset edge (4,5) to normal
-            edge_to_reset = get_edge_key(4, 5)
-            if edge_to_reset in alg_graph.edges:
-                self.play(
-                    alg_graph.edges[edge_to_reset].animate.set_stroke(WHITE, width=edge_width),
-                    run_time=0.6,
-                )
-            
-            # Reset vertex 5 to normal
-            self.play(
-                alg_graph.vertices[5].animate.set_fill(WHITE),
-                label_dict[5].animate.set_color(BLACK),
-                run_time=0.6,
-            )
-            
-            # Remove 5 from visited items display
-            if len(visited_items) > 0:
-                item_to_remove = visited_items[-1]
-                visited_items.remove(item_to_remove)
-                self.play(FadeOut(item_to_remove), run_time=0.5)
-                self.remove(item_to_remove)
-            
-            # Pop 5 from stack
-            pop_from_stack()
-            self.wait(1)
-            
-            # BACKTRACK further: Pop 4 from stack and path
+            self.wait(self.PAUSE)
+
+            backtrack(4, 5)
+
+            # BACKTRACK further: Pop 4 from stack and path, reset edge (3,4) and vertex 4
             update_status("Backtracking: removing vertex 4 from path...")
-            self.wait(1)
-            
-            # Remove 4 from visited set
-            visited_set.remove(4)
-            path.pop()  # Remove 4 from path
-            last_edge = current_path_edges.pop()  # Remove edge (3,4)
-            
-            # Reset edge (3,4) to normal
-            edge_to_reset = get_edge_key(3, 4)
-            if edge_to_reset in alg_graph.edges:
-                self.play(
-                    alg_graph.edges[edge_to_reset].animate.set_stroke(WHITE, width=edge_width),
-                    run_time=0.6,
-                )
-            
-            # Reset vertex 4 to normal
-            self.play(
-                alg_graph.vertices[4].animate.set_fill(WHITE),
-                label_dict[4].animate.set_color(BLACK),
-                run_time=0.6,
-            )
-            
-            # Remove 4 from visited items display
-            if len(visited_items) > 0:
-                item_to_remove = visited_items[-1]
-                visited_items.remove(item_to_remove)
-                self.play(FadeOut(item_to_remove), run_time=0.5)
-                self.remove(item_to_remove)
-            
-            # Pop 4 from stack
-            pop_from_stack()
-            self.wait(1)
-            
+            self.wait(self.PAUSE)
+
+            backtrack(3, 4)
+
             # Now at vertex 3: Try alternative path 3 -> 5
             # Backtracking finished, start exploring again
             update_status("Exploring alternative path 3 -> 5...")
-            self.wait(1)
-            
+            self.wait(self.PAUSE)
+
             # Step: 3 -> 5
-            prev_v = 3
-            next_v = 5
-            edge_key = get_edge_key(prev_v, next_v)
-            path.append(next_v)
-            visited_set.add(next_v)
-            current_path_edges.append(edge_key)
-            
-            self.play(
-                alg_graph.vertices[next_v].animate.set_fill(YELLOW),
-                label_dict[next_v].animate.set_color(BLACK),
-                alg_graph.edges[edge_key].animate.set_stroke(ORANGE, width=edge_width + 1),
-                run_time=1.0,
-            )
-            push_to_stack(next_v)
-            visited_item = MathTex(str(next_v), font_size=16, color=BLUE)
-            visited_item.next_to(visited_items[-1], RIGHT, buff=0.3)
-            visited_item.align_to(visited_items[-1], DOWN)
-            visited_items.add(visited_item)
-            self.add(visited_item)
-            self.play(FadeIn(visited_item, scale=0.9), run_time=0.5)
-            self.wait(1)
-            
+            step_to(3, 5)
+
             # Step: 5 -> 4
             update_status("At vertex 5: going to vertex 4...")
-            self.wait(1)
-            
-            prev_v = 5
-            next_v = 4
-            edge_key = get_edge_key(prev_v, next_v)
-            path.append(next_v)
-            visited_set.add(next_v)
-            current_path_edges.append(edge_key)
-            
-            self.play(
-                alg_graph.vertices[next_v].animate.set_fill(YELLOW),
-                label_dict[next_v].animate.set_color(BLACK),
-                alg_graph.edges[edge_key].animate.set_stroke(ORANGE, width=edge_width + 1),
-                run_time=1.0,
-            )
-            push_to_stack(next_v)
-            visited_item = MathTex(str(next_v), font_size=16, color=BLUE)
-            visited_item.next_to(visited_items[-1], RIGHT, buff=0.3)
-            visited_item.align_to(visited_items[-1], DOWN)
-            visited_items.add(visited_item)
-            self.add(visited_item)
-            self.play(FadeIn(visited_item, scale=0.9), run_time=0.5)
-            self.wait(1)
-            
+
+            step_to(5, 4)
+
             # At vertex 4: Check if we can complete the cycle
             # Path is [1, 2, 3, 5, 4], visited = {1, 2, 3, 4, 5}
             # All vertices visited! Check if edge 4->1 exists
             update_status("At vertex 4: all vertices visited! Checking cycle completion...")
-            self.wait(1)
-        
-        # Verify all vertices are visited
-        all_visited = len(visited_set) == len(v_alg)
-        path_complete = len(path) == len(v_alg)
-        
-        status_msg = f"Visited: {len(visited_set)}/{len(v_alg)}, Path length: {len(path)}/{len(v_alg)}"
-        update_status(status_msg)
-        self.wait(1)
-        
-        if not all_visited or not path_complete:
-            update_status(f"Error: Not all vertices visited! Missing: {set(v_alg) - visited_set}")
-            self.wait(1)
-            return
-        
-        # Check if edge 4->1 exists
-        return_edge_key = get_edge_key(4, 1)
-        if return_edge_key not in alg_graph.edges:
-            update_status("Dead end: no edge 4 -> 1. Cannot complete cycle.")
-            self.wait(1)
-            return
         
         # All conditions met: complete the cycle
         update_status("All conditions met! Edge 4 -> 1 exists. Completing cycle...")
-        self.wait(1)
         
-        prev_v = 4
-        next_v = 1
-        edge_key = return_edge_key
+        edge_key = EKEYS[(4, 1)]
         current_path_edges.append(edge_key)
         
         update_status("Hamiltonian cycle found: 1 -> 2 -> 3 -> 5 -> 4 -> 1")
-        self.wait(1)
+        self.wait(self.PAUSE)
         
         # Highlight the return edge (4->1) prominently
-        if edge_key in alg_graph.edges:
-            edge_mob = alg_graph.edges[edge_key]
-            # Flash the edge to make it visible
-            self.play(
-                edge_mob.animate.set_stroke(YELLOW, width=edge_width + 3),
-                run_time=0.5,
-            )
-            self.wait(1)
-            # Then set it to green
-            self.play(
-                alg_graph.vertices[next_v].animate.set_fill(GREEN),
-                label_dict[next_v].animate.set_color(WHITE),
-                edge_mob.animate.set_stroke(GREEN, width=edge_width + 2),
-                run_time=1.0,
-            )
-        else:
-            self.play(
-                alg_graph.vertices[next_v].animate.set_fill(GREEN),
-                label_dict[next_v].animate.set_color(WHITE),
-                run_time=1.0,
-            )
-        self.wait(1)
+        edge_mob = alg_edges[edge_key]
+        # Flash the edge yellow, then settle it (and vertex 1) on green in one play.
+        # Build the flash before the green step: both target edge_mob, and an
+        # unbuilt builder would pick up the later target
+        flash = edge_mob.animate(run_time=0.5).set_stroke(YELLOW, width=EW3).build()
+        settle = AnimationGroup(
+            edge_mob.animate.set_stroke(GREEN, width=EW2),
+            alg_graph.vertices[1].animate.set_fill(GREEN),
+            label_dict[1].animate.set_color(WHITE),
+            run_time=1.0,
+        )
+        self.play(Succession(flash, Wait(1), settle))
 
         # Prompt 18: Hamiltonian Cycle Found
-        self.wait(1)
 
         # Highlight all cycle edges in green
         # Cycle is: 1 -> 2 -> 3 -> 5 -> 4 -> 1
         # Edges: (1,2), (2,3), (3,5), (5,4), (4,1)
-        # Build cycle edges explicitly from the path
-        final_cycle_edges = []
-        # Add all edges from current_path_edges (path edges)
+        # Build cycle edges from the path, then the explicit cycle 1->2->3->5->4->1
+        # (which includes the return edge 4->1); the dict keeps first-seen order
+        seen = {}
         for e in current_path_edges:
-            if isinstance(e, tuple) and len(e) == 2:
-                key = get_edge_key(e[0], e[1])
-            else:
-                key = e
-            if key in alg_graph.edges and key not in final_cycle_edges:
-                final_cycle_edges.append(key)
-        
-        # Add the return edge (4,1) to complete the cycle
-        return_edge_key_final = get_edge_key(4, 1)
-        if return_edge_key_final in alg_graph.edges and return_edge_key_final not in final_cycle_edges:
-            final_cycle_edges.append(return_edge_key_final)
-        
-        # Also explicitly check all edges in the cycle path: 1->2->3->5->4->1
-        cycle_path_edges = [
-            (1, 2), (2, 3), (3, 5), (5, 4), (4, 1)
-        ]
-        for u, v in cycle_path_edges:
-            edge_k = get_edge_key(u, v)
-            if edge_k in alg_graph.edges and edge_k not in final_cycle_edges:
-                final_cycle_edges.append(edge_k)
+            k = get_edge_key(*e) if isinstance(e, tuple) else e
+            if k in alg_edges:
+                seen[k] = None
+        for u, v in [(1, 2), (2, 3), (3, 5), (5, 4), (4, 1)]:
+            k = EKEYS[(u, v)]
+            if k in alg_edges:
+                seen[k] = None
+        final_cycle_edges = list(seen)
         
         # Also highlight all vertices in the cycle in green
         cycle_vertices = [1, 2, 3, 5, 4]
-        vertex_anims = [
-            alg_graph.vertices[v].animate.set_fill(GREEN)
-            for v in cycle_vertices
-        ]
-        label_anims = [
-            label_dict[v].animate.set_color(WHITE)
-            for v in cycle_vertices
-        ]
-        edge_anims = [
-            alg_graph.edges[e].animate.set_stroke(GREEN, width=edge_width + 2)
-            for e in final_cycle_edges
-        ]
+        verts_vg = VGroup(*[alg_graph.vertices[v] for v in cycle_vertices])
+        labels_vg = VGroup(*[label_dict[v] for v in cycle_vertices])
+        edges_vg = VGroup(*[alg_edges[e] for e in final_cycle_edges])
         
         self.play(
-            *vertex_anims,
-            *label_anims,
-            *edge_anims,
+            verts_vg.animate.set_fill(GREEN),
+            labels_vg.animate.set_color(WHITE),
+            edges_vg.animate.set_stroke(GREEN, width=EW2),
             run_time=1.5,
         )
-        self.wait(1)
 
         # Prompt 17: Show final path summary
-        # Explicit LaTeX arrows so the text renders cleanly
+        # Unicode arrows keep this plain Text, no LaTeX run needed
         # Cycle: 1 -> 2 -> 3 -> 5 -> 4 -> 1
-        summary_text = MathTex(
-            r"\text{Hamiltonian Cycle: } 1 \to 2 \to 3 \to 5 \to 4 \to 1",
+        summary_text = Text(
+            "Hamiltonian Cycle: 1 → 2 → 3 → 5 → 4 → 1",
             font_size=24,
             color=GREEN,
         ).next_to(status_text, UP, buff=0.3)
         self.play(Write(summary_text), run_time=1.0)
-        self.wait(1)
-
-        self.play(
-            FadeOut(alg_graph),
-            FadeOut(alg_node_labels),
-            FadeOut(title_bt),
-            FadeOut(stack_label),
-            FadeOut(stack_container),
-            FadeOut(stack_inner),
-            FadeOut(visited_label),
-            FadeOut(visited_items),
-            FadeOut(stack_items),
-            FadeOut(status_text),
-            FadeOut(summary_text),
-            run_time=1.0,
+        self.wait(self.PAUSE)
+
+        cleanup = Group(
+            alg_graph,
+            alg_node_labels,
+            title_bt,
+            stack_label,
+            stack_container,
+            stack_inner,
+            visited_label,
+            visited_items,
+            stack_items,
+            status_text,
+            summary_text,
         )
-        self.wait(1)
+        self.play(FadeOut(cleanup), run_time=1.0)
 
+    def summary(self):
+        """Summarize the Hamiltonian concepts covered."""
         # ============================================================
         # Summary
         # ============================================================
@@ -1126,11 +1019,11 @@ class HamiltonConcepts(Scene):
         self.play(summary_title.animate.to_edge(UP), run_time=0.8)
 
         summary_points = VGroup(
-            MathTex(r"\text{Hamilton Path: visits every vertex once, different start/end}", font_size=26),
-            MathTex(r"\text{Hamilton Cycle: visits every vertex once, returns to start}", font_size=26),
-            MathTex(r"\text{Ore's Theorem: } \deg(u) + \deg(v) \geq n \Rightarrow \text{ Hamiltonian}", font_size=26),
-            MathTex(r"\text{Dirac's Theorem: } \deg(v) \geq n/2 \Rightarrow \text{ Hamiltonian cycle}", font_size=26),
-            MathTex(r"\text{Backtracking: systematic search for Hamiltonian cycles}", font_size=26),
+            Text("Hamilton Path: visits every vertex once, different start/end", font_size=26),
+            Text("Hamilton Cycle: visits every vertex once, returns to start", font_size=26),
+            mathtex_proto(r"\text{Ore's Theorem: } \deg(u) + \deg(v) \geq n \Rightarrow \text{ Hamiltonian}", 26).copy(),
+            mathtex_proto(r"\text{Dirac's Theorem: } \deg(v) \geq n/2 \Rightarrow \text{ Hamiltonian cycle}", 26).copy(),
+            Text("Backtracking: systematic search for Hamiltonian cycles", font_size=26),
         ).arrange(DOWN, buff=0.4, aligned_edge=LEFT)
         summary_points.next_to(summary_title, DOWN, buff=0.6)
         self.play(Write(summary_points), run_time=2.5)
@@ -1142,3 +1035,15 @@ class HamiltonConcepts(Scene):
         )
         self.wait(1)
 
+    def construct(self):
+        self.build_base_graph()
+        self.intro()
+        self.hamilton_path()
+        self.hamilton_cycle()
+        self.hamiltonian_graph()
+        self.shelby()
+        self.ore()
+        self.dirac()
+        self.algorithm_types()
+        self.backtracking_demo()
+        self.summary()
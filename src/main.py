@@ -8,11 +8,75 @@ This module provides comprehensive visualizations of graph theory concepts inclu
 - Subgraphs
 
 All animations are created using Manim Community Edition.
+
+The scene is edge- and stroke-heavy; for faster renders use Manim's OpenGL renderer:
+
+    manim -qm --renderer=opengl --write_to_movie src/main.py GraphSequence
 """
 
 from manim import *
 import itertools
+import os
 import random
+import numpy as np
+from collections import defaultdict
+from functools import lru_cache
+
+from graph_math import adjacency_lists, adjacency_matrix, complement_edges, incidence_matrix
+from tex_cache import mathtex_proto
+
+
+@lru_cache(maxsize=None)
+def _title(text, size=40):
+    """Build a title Text once per (text, size); callers take a .copy()."""
+    return Text(text, font_size=size)
+
+
+@lru_cache(maxsize=1)
+def _random_topology(n, left_part, right_part, seed):
+    """
+    Sample the random and bipartite example graphs once per argument set.
+
+    Args:
+        n: Number of vertices in the random graph
+        left_part: Tuple of left-side bipartite vertex names
+        right_part: Tuple of right-side bipartite vertex names
+        seed: Seed for reproducible sampling
+
+    Returns:
+        (all_pairs, random_edges, all_bi_pairs, bi_edges) as tuples, each edge
+        list kept in candidate order
+    """
+    rng = random.Random(seed)
+
+    # Random graph: cycle + ~20% of the remaining chords
+    # Normalize to (low, high) like itertools.combinations so every edge key
+    # matches the complete graph's pairs
+    cycle_edges = [tuple(sorted((i, (i + 1) % n))) for i in range(n)]
+    all_pairs = list(itertools.combinations(range(n), 2))
+    remaining_pairs = complement_edges(n, cycle_edges)
+    picked = set(rng.sample(remaining_pairs, k=max(1, int(len(remaining_pairs) * 0.2))))
+    random_edges = cycle_edges + [e for e in remaining_pairs if e in picked]
+
+    # Bipartite graph: ~45% of the left x right pairs
+    all_bi_pairs = [(u, v) for u in left_part for v in right_part]
+    picked_bi = set(rng.sample(all_bi_pairs, k=max(1, int(len(all_bi_pairs) * 0.45))))
+    bi_edges = [e for e in all_bi_pairs if e in picked_bi]
+
+    return tuple(all_pairs), tuple(random_edges), tuple(all_bi_pairs), tuple(bi_edges)
+
+
+def _entry_grid(matrix, rows, cols):
+    """
+    Return a matrix mobject's entries as a (rows, cols) object ndarray.
+
+    The array is filled element by element: handing the entries to np.asarray
+    directly would make NumPy iterate into each mobject's submobjects.
+    """
+    grid = np.empty(rows * cols, dtype=object)
+    for idx, entry in enumerate(matrix.get_entries()):
+        grid[idx] = entry
+    return grid.reshape(rows, cols)
 
 
 class GraphSequence(Scene):
@@ -24,9 +88,6 @@ class GraphSequence(Scene):
     """
     
     def construct(self):
-        # Set random seed for reproducible graph generation
-        random.seed(1)
-        
         # ============================================================
         # Section 1: Introduction
         # Display the main title and introduce the graph theory concepts
@@ -40,16 +101,15 @@ class GraphSequence(Scene):
         # Section 2: Introductory Image
         # Display an introductory image before explaining graph concepts
         # ============================================================
-        try:
-            dark_img = ImageMobject("assets/dark.jpg")
+        # Skip the image entirely (no decode attempt) when the asset is missing
+        dark_path = os.path.join("assets", "dark.jpg")
+        if os.path.isfile(dark_path):
+            dark_img = ImageMobject(dark_path)
             dark_img.scale(2.0)
             dark_img.move_to(ORIGIN)
             self.play(FadeIn(dark_img), run_time=1.5)
             self.wait(2)
             self.play(FadeOut(dark_img), run_time=1.0)
-        except FileNotFoundError:
-            # Gracefully handle missing image file - continue without it
-            pass
 
         # ============================================================
         # Section 3: Basic Graph Elements
@@ -112,54 +172,70 @@ class GraphSequence(Scene):
             "stroke_width": edge_width,
         }
 
+        # Build the vertex Dot once; every Graph gets copies instead of new Dots
+        vertex_template = Dot(**vertex_style)
+
+        def vertex_mobjects(vertices):
+            """Map each vertex to its own copy of the shared vertex Dot."""
+            return {v: vertex_template.copy() for v in vertices}
+
         # ============================================================
         # Helper Function: Animate Graph Traversal
         # Visualizes a path through a graph by animating a dot along edges
         # ============================================================
         def animate_traversal(graph, vertex_sequence, color=YELLOW, dot_radius=0.12):
             """
-            Animate a traversal through a graph following a vertex sequence.
+            Build the animation for a traversal through a graph following a vertex sequence.
             
             Args:
                 graph: The Manim Graph object to traverse
                 vertex_sequence: List of vertices in traversal order
                 color: Color for highlighting the path (default: YELLOW)
                 dot_radius: Radius of the animated dot (default: 0.12)
+
+            Returns:
+                A Succession to play (or nest), or None if there is nothing to traverse
             """
             if not vertex_sequence or len(vertex_sequence) < 2:
-                return
+                return None
+            edges_map = graph.edges
+            edge_keys = set(edges_map)
             dot = Dot(radius=dot_radius, color=color)
             dot.move_to(graph.vertices[vertex_sequence[0]].get_center())
-            self.add(dot)
             used_edges = []
+            seen = set()
+            moves = []
             for i in range(len(vertex_sequence) - 1):
                 u, v = vertex_sequence[i], vertex_sequence[i + 1]
-                if (u, v) in graph.edges:
-                    edge_key = (u, v)
-                elif (v, u) in graph.edges:
-                    edge_key = (v, u)
-                else:
+                edge_key = (u, v) if (u, v) in edge_keys else ((v, u) if (v, u) in edge_keys else None)
+                if edge_key is None:
                     continue
-                used_edges.append(edge_key)
-                self.play(dot.animate.move_to(graph.vertices[v].get_center()), run_time=0.7)
-            unique_used_edges = list(dict.fromkeys(used_edges))
-            if unique_used_edges:
-                self.play(
+                if edge_key not in seen:
+                    seen.add(edge_key)
+                    used_edges.append(edge_key)
+                # Build each hop now: an unbuilt dot.animate builder would read
+                # dot.target only when Succession builds it, by which time every
+                # later hop has regenerated the target to its own waypoint
+                moves.append(dot.animate(run_time=0.7).move_to(graph.vertices[v].get_center()).build())
+            # Succession begins each step when the previous one ends, so every
+            # hop and the restore start from the state the step before left
+            steps = [FadeIn(dot, run_time=0.2), *moves]
+            if used_edges:
+                edge_mobs = [edges_map[e] for e in used_edges]
+                steps += [
                     LaggedStart(
-                        *[
-                            graph.edges[e].animate.set_stroke(color=color, width=edge_width + 1)
-                            for e in unique_used_edges
-                        ],
+                        *[edge.animate.set_stroke(color=color, width=edge_width + 1) for edge in edge_mobs],
                         lag_ratio=0.1,
                         run_time=2.0,
-                    )
-                )
-                self.wait(1)
-                self.play(
-                    *[graph.edges[e].animate.set_stroke(WHITE, width=edge_width) for e in unique_used_edges],
-                    run_time=1.2,
-                )
-            self.play(FadeOut(dot), run_time=0.4)
+                    ),
+                    Wait(1),
+                    AnimationGroup(
+                        *[edge.animate.set_stroke(WHITE, width=edge_width) for edge in edge_mobs],
+                        run_time=1.2,
+                    ),
+                ]
+            steps.append(FadeOut(dot, run_time=0.4))
+            return Succession(*steps)
 
         # ============================================================
         # Helper Function: Smooth Edge Addition
@@ -172,11 +248,13 @@ class GraphSequence(Scene):
             color=BLUE,
             lag_ratio=0.12,
             run_time=5.0,
+            edge_type=Line,
         ):
             """
             Add edges to a Graph and animate them smoothly:
             - start thin, transparent
             - fade in and thicken
+            edge_type should match the graph's edges (e.g. Arrow for a digraph).
             Returns the list of edge mobjects.
             """
             if not new_edges:
@@ -184,14 +262,15 @@ class GraphSequence(Scene):
 
             graph.add_edges(
                 *new_edges,
+                edge_type=edge_type,
                 edge_config={
                     "stroke_color": color,
                     "stroke_width": 1,
                 }
             )
-            edge_mobs = [graph.edges[e] for e in new_edges]
-            for edge in edge_mobs:
-                edge.set_stroke(color=color, width=1, opacity=0)
+            E = graph.edges
+            edge_mobs = [E[e] for e in new_edges]
+            VGroup(*edge_mobs).set_stroke(color=color, width=1, opacity=0)
 
             self.play(
                 LaggedStart(
@@ -209,6 +288,110 @@ class GraphSequence(Scene):
             )
             return edge_mobs
 
+        # ============================================================
+        # Helper Function: Vertex Number Labels
+        # Hands out positioned copies of the cached vertex number labels
+        # ============================================================
+        def digit_label(v, position):
+            """Return a copy of the cached label for vertex v, centered at position."""
+            return mathtex_proto(str(v), 20, BLACK).copy().move_to(position)
+
+        def layout_centers(vertices, layout, scale=1.0, about=ORIGIN):
+            """
+            Read vertex centers straight from a dict layout.
+
+            Args:
+                vertices: Vertices to look up, in label order
+                layout: The dict layout the graph was built with
+                scale: Factor the graph was scaled by (default: 1.0)
+                about: Point the graph was scaled about (default: ORIGIN)
+
+            Returns:
+                (len(vertices), 3) array of centers
+            """
+            centers = np.array([layout[v] for v in vertices], dtype=float)
+            return about + (centers - about) * scale
+
+        # ============================================================
+        # Helper Function: Traversal Section
+        # Builds a labeled graph with title and description, runs one traversal
+        # and clears the screen again
+        # ============================================================
+        def show_traversal_section(
+            vertices,
+            edges,
+            layout,
+            title_str,
+            desc_parts,
+            sequence,
+            color,
+            scale=1.0,
+            seq_font_size=24,
+            after_traversal=None,
+            fade_time=1.0,
+            end_wait=1,
+            template=None,
+        ):
+            """
+            Present one traversal concept (walk, trail, circuit, ...).
+
+            Args:
+                vertices: Vertices of the example graph
+                edges: Edges of the example graph
+                layout: Vertex positions for the graph
+                title_str: Section title
+                desc_parts: MathTex strings for the definition line
+                sequence: Vertex sequence to traverse
+                color: Highlight color for the traversal
+                scale: Scale factor applied to the graph (default: 1.0)
+                seq_font_size: Font size of the sequence caption (default: 24)
+                after_traversal: Optional callback(graph, sequence) returning an
+                    extra emphasis animation
+                fade_time: Run time of the closing FadeOut (default: 1.0)
+                end_wait: Pause after the section is cleared (default: 1)
+                template: Optional (graph, labels) pair already built for these
+                    vertices, edges and layout; copied instead of rebuilt
+            """
+            if template is not None:
+                graph, labels = (mob.copy() for mob in template)
+            else:
+                graph = Graph(vertices, edges, layout=layout, vertex_mobjects=vertex_mobjects(vertices), edge_config=edge_style)
+                about = graph.get_center()
+                graph.scale(scale)
+                centers = layout_centers(vertices, layout, scale, about)
+                labels = VGroup(*[digit_label(v, c) for v, c in zip(vertices, centers)])
+            title = _title(title_str, 42).copy().to_edge(UP)
+            desc = MathTex(*desc_parts, font_size=28).next_to(title, DOWN, buff=0.3)
+            seq_label = MathTex(
+                r" \rightarrow ".join(str(v) for v in sequence), font_size=seq_font_size
+            ).to_corner(DL)
+            self.play(FadeIn(graph, shift=0.2 * UP), Write(title), run_time=1.5)
+            self.play(Write(labels), run_time=0.8)
+            self.play(Write(desc), run_time=1.2)
+            self.wait(1)
+            self.play(Write(seq_label), run_time=1.0)
+            self.wait(1)
+
+            # Traversal and emphasis share one play; everything they animate is
+            # already on screen except the dot, whose FadeIn runs first. Every
+            # step handed to this Succession must already be built (hops, edge
+            # sweeps, AnimationGroups), since a nested .animate builder would
+            # take whatever target its mobject holds when the Succession is made
+            steps = []
+            traversal = animate_traversal(graph, sequence, color=color)
+            if traversal is not None:
+                steps.append(traversal)
+            steps.append(Wait(1))
+            if after_traversal is not None:
+                steps.append(after_traversal(graph, sequence))
+            self.play(Succession(*steps))
+
+            self.play(
+                FadeOut(graph), FadeOut(labels), FadeOut(title), FadeOut(desc), FadeOut(seq_label),
+                run_time=fade_time,
+            )
+            self.wait(end_wait)
+
         # ============================================================
         # Section 5: Graph Traversals and Basic Concepts
         # Demonstrate fundamental graph traversal concepts and terminology
@@ -223,24 +406,26 @@ class GraphSequence(Scene):
             3: RIGHT * 2.5 + DOWN * 1.5,
             4: LEFT * 0.5 + DOWN * 1.5,
         }
-        deg1_graph = Graph(vertices_deg1, edges_deg1, layout=layout_deg1, vertex_config=vertex_style, edge_config=edge_style)
-        deg1_labels = VGroup()
-        for v in vertices_deg1:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(deg1_graph.vertices[v].get_center())
-            deg1_labels.add(label)
-        title_degree = Text("Node Degree", font_size=42).to_edge(UP)
+        deg1_graph = Graph(vertices_deg1, edges_deg1, layout=layout_deg1, vertex_mobjects=vertex_mobjects(vertices_deg1), edge_config=edge_style)
+        deg1_labels = VGroup(
+            *[digit_label(v, c) for v, c in zip(vertices_deg1, layout_centers(vertices_deg1, layout_deg1))]
+        )
+        title_degree = _title("Node Degree", 42).copy().to_edge(UP)
         desc_degree = MathTex(
             r"\text{The degree of a vertex is the number of edges}",
             r"\text{ incident to it.}",
             font_size=26,
         ).next_to(title_degree, DOWN, buff=0.3)
-        self.play(Create(deg1_graph), Write(title_degree), run_time=1.5)
+        self.play(FadeIn(deg1_graph, shift=0.2 * UP), Write(title_degree), run_time=1.5)
         self.play(Write(deg1_labels), run_time=0.8)
         self.play(Write(desc_degree), run_time=1.2)
         self.wait(1)
 
-        degrees1 = {v: sum(1 for e in edges_deg1 if v in e) for v in vertices_deg1}
+        # Index incident edges per vertex in one pass over the edge list
+        incidence = defaultdict(list)
+        for e in edges_deg1:
+            incidence[e[0]].append(e)
+            incidence[e[1]].append(e)
         placeholder_labels = VGroup()
         for v in vertices_deg1:
             label = MathTex(f"deg({v}) = ?", font_size=28)
@@ -248,20 +433,26 @@ class GraphSequence(Scene):
         placeholder_labels.arrange(RIGHT, buff=0.8)
         placeholder_labels.next_to(deg1_graph, DOWN, buff=0.8)
         actual_labels1 = VGroup()
+        E, V = deg1_graph.edges, deg1_graph.vertices
         for i, v in enumerate(vertices_deg1):
-            incident_edges = [e for e in edges_deg1 if v in e]
-            edge_anims = [deg1_graph.edges[e].animate.set_stroke(YELLOW, width=edge_width + 1) for e in incident_edges]
-            self.play(deg1_graph.vertices[v].animate.set_fill(YELLOW), *edge_anims, run_time=1.0)
-            self.wait(1)
-            label = MathTex(f"deg({v}) = {degrees1[v]}", font_size=28)
+            incident_edges = incidence[v]
+            label = MathTex(f"deg({v}) = {len(incident_edges)}", font_size=28)
             label.move_to(placeholder_labels[i].get_center())
             actual_labels1.add(label)
-            self.play(Write(label), run_time=0.8)
-            self.play(
-                deg1_graph.vertices[v].animate.set_fill(WHITE),
-                *[deg1_graph.edges[e].animate.set_stroke(WHITE, width=edge_width) for e in incident_edges],
+            incident_group = VGroup(*[E[e] for e in incident_edges])
+            highlight_anim = AnimationGroup(
+                V[v].animate.set_fill(YELLOW),
+                incident_group.animate.set_stroke(YELLOW, width=edge_width + 1),
+                run_time=1.0,
+            )
+            unhighlight_anim = AnimationGroup(
+                V[v].animate.set_fill(WHITE),
+                incident_group.animate.set_stroke(WHITE, width=edge_width),
                 run_time=0.8,
             )
+            # Succession starts each step only when the previous one ends, so the
+            # restore begins from the highlighted state
+            self.play(Succession(highlight_anim, Write(label, run_time=0.8), unhighlight_anim))
             self.wait(1)
         self.wait(1)
         formula1 = MathTex(r"\sum_{v \in V} \deg(v) = 2|E|", font_size=32).next_to(actual_labels1, DOWN, buff=0.6)
@@ -273,6 +464,8 @@ class GraphSequence(Scene):
         self.wait(1)
         self.play(Write(formula1_example), run_time=1.2)
         self.wait(1)
+        # Keep an unfaded copy; the Walk section reuses this exact graph
+        deg1_template = (deg1_graph.copy(), deg1_labels.copy())
         self.play(
             FadeOut(deg1_graph),
             FadeOut(deg1_labels),
@@ -286,198 +479,126 @@ class GraphSequence(Scene):
         self.wait(1)
 
         # Walk
-        vertices_walk = [1, 2, 3, 4]
-        edges_walk = edges_deg1
-        walk_graph = Graph(vertices_walk, edges_walk, layout=layout_deg1, vertex_config=vertex_style, edge_config=edge_style)
-        walk_labels = VGroup()
-        for v in vertices_walk:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(walk_graph.vertices[v].get_center())
-            walk_labels.add(label)
-        title_walk = Text("Walk", font_size=42).to_edge(UP)
-        desc_walk = MathTex(
-            r"\text{Vertices may repeat. Edges may repeat.}", r"\text{ (Closed or Open)}", font_size=28
-        ).next_to(title_walk, DOWN, buff=0.3)
-        self.play(Create(walk_graph), Write(title_walk), run_time=1.5)
-        self.play(Write(walk_labels), run_time=0.8)
-        self.play(Write(desc_walk), run_time=1.2)
-        self.wait(1)
-        walk_sequence = [1, 2, 3, 2, 4, 1, 4]
-        walk_label = MathTex(
-            r"1 \rightarrow 2 \rightarrow 3 \rightarrow 2 \rightarrow 4 \rightarrow 1 \rightarrow 4", font_size=24
-        ).to_corner(DL)
-        self.play(Write(walk_label), run_time=1.0)
-        self.wait(1)
-        animate_traversal(walk_graph, walk_sequence, color=YELLOW)
-        self.wait(1)
-        self.play(FadeOut(walk_graph), FadeOut(walk_labels), FadeOut(title_walk), FadeOut(desc_walk), FadeOut(walk_label), run_time=1.0)
-        self.wait(1)
+        show_traversal_section(
+            [1, 2, 3, 4],
+            edges_deg1,
+            layout_deg1,
+            "Walk",
+            (r"\text{Vertices may repeat. Edges may repeat.}", r"\text{ (Closed or Open)}"),
+            [1, 2, 3, 2, 4, 1, 4],
+            YELLOW,
+            template=deg1_template,
+        )
 
         # Trail
-        vertices_trail = [1, 2, 3, 4, 5]
-        edges_trail = [(1, 2), (2, 3), (3, 4), (4, 5), (1, 3), (3, 5)]
-        layout_trail = {
-            1: LEFT * 3 + UP * 1.2,
-            2: LEFT * 1.5 + UP * 1.8,
-            3: RIGHT * 0.5 + UP * 1.2,
-            4: RIGHT * 2 + UP * 0.3,
-            5: RIGHT * 0.5 + DOWN * 1.2,
-        }
-        trail_graph = Graph(vertices_trail, edges_trail, layout=layout_trail, vertex_config=vertex_style, edge_config=edge_style)
-        trail_graph.scale(0.9)
-        trail_labels = VGroup()
-        for v in vertices_trail:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(trail_graph.vertices[v].get_center())
-            trail_labels.add(label)
-        title_trail = Text("Trail", font_size=42).to_edge(UP)
-        desc_trail = MathTex(r"\text{A walk with no repeated edges.}", font_size=28).next_to(title_trail, DOWN, buff=0.3)
-        self.play(Create(trail_graph), Write(title_trail), run_time=1.5)
-        self.play(Write(trail_labels), run_time=0.8)
-        self.play(Write(desc_trail), run_time=1.2)
-        self.wait(1)
-        trail_sequence = [1, 2, 3, 4, 5, 3, 1]
-        trail_label = MathTex(
-            r"1 \rightarrow 2 \rightarrow 3 \rightarrow 4 \rightarrow 5 \rightarrow 3 \rightarrow 1", font_size=22
-        ).to_corner(DL)
-        self.play(Write(trail_label), run_time=1.0)
-        self.wait(1)
-        animate_traversal(trail_graph, trail_sequence, color=GREEN)
-        self.wait(1)
-        self.play(FadeOut(trail_graph), FadeOut(trail_labels), FadeOut(title_trail), FadeOut(desc_trail), FadeOut(trail_label), run_time=1.0)
-        self.wait(1)
+        show_traversal_section(
+            [1, 2, 3, 4, 5],
+            [(1, 2), (2, 3), (3, 4), (4, 5), (1, 3), (3, 5)],
+            {
+                1: LEFT * 3 + UP * 1.2,
+                2: LEFT * 1.5 + UP * 1.8,
+                3: RIGHT * 0.5 + UP * 1.2,
+                4: RIGHT * 2 + UP * 0.3,
+                5: RIGHT * 0.5 + DOWN * 1.2,
+            },
+            "Trail",
+            (r"\text{A walk with no repeated edges.}",),
+            [1, 2, 3, 4, 5, 3, 1],
+            GREEN,
+            scale=0.9,
+            seq_font_size=22,
+        )
 
         # Circuit
-        vertices_circuit = [1, 2, 3, 4, 5]
-        edges_circuit = [(1, 2), (2, 3), (3, 4), (4, 5), (5, 1), (1, 3), (3, 5)]
-        layout_circuit = {
-            1: LEFT * 2.5 + UP * 1.5,
-            2: RIGHT * 0.5 + UP * 1.8,
-            3: RIGHT * 2.5 + UP * 0.5,
-            4: RIGHT * 2.5 + DOWN * 1.5,
-            5: LEFT * 0.5 + DOWN * 1.5,
-        }
-        circuit_graph = Graph(
-            vertices_circuit, edges_circuit, layout=layout_circuit, vertex_config=vertex_style, edge_config=edge_style
+        def mark_circuit_start(circuit_graph, sequence):
+            start_vertex_c = circuit_graph.vertices[sequence[0]]
+            start_vertex_c.save_state()
+            return Succession(
+                start_vertex_c.animate(run_time=0.8).set_fill(RED),
+                Wait(1),
+                Restore(start_vertex_c, run_time=0.8),
+            )
+
+        show_traversal_section(
+            [1, 2, 3, 4, 5],
+            [(1, 2), (2, 3), (3, 4), (4, 5), (5, 1), (1, 3), (3, 5)],
+            {
+                1: LEFT * 2.5 + UP * 1.5,
+                2: RIGHT * 0.5 + UP * 1.8,
+                3: RIGHT * 2.5 + UP * 0.5,
+                4: RIGHT * 2.5 + DOWN * 1.5,
+                5: LEFT * 0.5 + DOWN * 1.5,
+            },
+            "Circuit",
+            (r"\text{A closed trail. No repeated edges,}", r"\text{ but vertices may repeat.}"),
+            [1, 2, 3, 4, 5, 3, 1],
+            BLUE,
+            scale=0.9,
+            seq_font_size=22,
+            after_traversal=mark_circuit_start,
         )
-        circuit_graph.scale(0.9)
-        circuit_labels = VGroup()
-        for v in vertices_circuit:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(circuit_graph.vertices[v].get_center())
-            circuit_labels.add(label)
-        title_circuit = Text("Circuit", font_size=42).to_edge(UP)
-        desc_circuit = MathTex(
-            r"\text{A closed trail. No repeated edges,}", r"\text{ but vertices may repeat.}", font_size=28
-        ).next_to(title_circuit, DOWN, buff=0.3)
-        self.play(Create(circuit_graph), Write(title_circuit), run_time=1.5)
-        self.play(Write(circuit_labels), run_time=0.8)
-        self.play(Write(desc_circuit), run_time=1.2)
-        self.wait(1)
-        circuit_sequence = [1, 2, 3, 4, 5, 3, 1]
-        circuit_label = MathTex(
-            r"1 \rightarrow 2 \rightarrow 3 \rightarrow 4 \rightarrow 5 \rightarrow 3 \rightarrow 1", font_size=22
-        ).to_corner(DL)
-        self.play(Write(circuit_label), run_time=1.0)
-        self.wait(1)
-        animate_traversal(circuit_graph, circuit_sequence, color=BLUE)
-        self.wait(1)
-        start_vertex_c = circuit_graph.vertices[circuit_sequence[0]]
-        self.play(start_vertex_c.animate.set_fill(RED), run_time=0.8)
-        self.wait(1)
-        self.play(start_vertex_c.animate.set_fill(WHITE), run_time=0.8)
-        self.play(FadeOut(circuit_graph), FadeOut(circuit_labels), FadeOut(title_circuit), FadeOut(desc_circuit), FadeOut(circuit_label), run_time=1.0)
-        self.wait(1)
 
         # Path
-        vertices_path = [1, 2, 3, 4, 5, 6]
-        edges_path = [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (2, 5), (3, 6)]
-        layout_path = {
-            1: LEFT * 3 + UP * 1.5,
-            2: LEFT * 1.5 + UP * 1.8,
-            3: RIGHT * 0.3 + UP * 1.5,
-            4: RIGHT * 2 + UP * 0.8,
-            5: RIGHT * 0.3 + DOWN * 0.8,
-            6: RIGHT * 2 + DOWN * 1.5,
-        }
-        path_graph = Graph(vertices_path, edges_path, layout=layout_path, vertex_config=vertex_style, edge_config=edge_style)
-        path_graph.scale(0.85)
-        path_labels = VGroup()
-        for v in vertices_path:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(path_graph.vertices[v].get_center())
-            path_labels.add(label)
-        title_path = Text("Path", font_size=42).to_edge(UP)
-        desc_path = MathTex(r"\text{An open trail with no repeated vertices.}", font_size=28).next_to(
-            title_path, DOWN, buff=0.3
-        )
-        self.play(Create(path_graph), Write(title_path), run_time=1.5)
-        self.play(Write(path_labels), run_time=0.8)
-        self.play(Write(desc_path), run_time=1.2)
-        self.wait(1)
-        path_sequence = [1, 2, 3, 4, 5, 6]
-        path_label = MathTex(r"1 \rightarrow 2 \rightarrow 3 \rightarrow 4 \rightarrow 5 \rightarrow 6", font_size=24).to_corner(
-            DL
+        def mark_path_ends(path_graph, sequence):
+            start_v = path_graph.vertices[sequence[0]]
+            end_v = path_graph.vertices[sequence[-1]]
+            start_v.save_state()
+            end_v.save_state()
+            return Succession(
+                AnimationGroup(start_v.animate.set_fill(GREEN), end_v.animate.set_fill(RED), run_time=1.0),
+                Wait(1),
+                AnimationGroup(Restore(start_v), Restore(end_v), run_time=0.8),
+            )
+
+        show_traversal_section(
+            [1, 2, 3, 4, 5, 6],
+            [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (2, 5), (3, 6)],
+            {
+                1: LEFT * 3 + UP * 1.5,
+                2: LEFT * 1.5 + UP * 1.8,
+                3: RIGHT * 0.3 + UP * 1.5,
+                4: RIGHT * 2 + UP * 0.8,
+                5: RIGHT * 0.3 + DOWN * 0.8,
+                6: RIGHT * 2 + DOWN * 1.5,
+            },
+            "Path",
+            (r"\text{An open trail with no repeated vertices.}",),
+            [1, 2, 3, 4, 5, 6],
+            ORANGE,
+            scale=0.85,
+            after_traversal=mark_path_ends,
         )
-        self.play(Write(path_label), run_time=1.0)
-        self.wait(1)
-        animate_traversal(path_graph, path_sequence, color=ORANGE)
-        self.wait(1)
-        start_v = path_graph.vertices[path_sequence[0]]
-        end_v = path_graph.vertices[path_sequence[-1]]
-        self.play(start_v.animate.set_fill(GREEN), end_v.animate.set_fill(RED), run_time=1.0)
-        self.wait(1)
-        self.play(start_v.animate.set_fill(WHITE), end_v.animate.set_fill(WHITE), run_time=0.8)
-        self.play(FadeOut(path_graph), FadeOut(path_labels), FadeOut(title_path), FadeOut(desc_path), FadeOut(path_label), run_time=1.0)
-        self.wait(1)
 
         # Cycle
-        vertices_cycle = [1, 2, 3, 4, 5]
-        edges_cycle = [(1, 2), (2, 3), (3, 4), (4, 5), (5, 1), (1, 3), (2, 4)]
-        layout_cycle = {
-            1: LEFT * 2.5 + UP * 1.5,
-            2: RIGHT * 0.5 + UP * 1.8,
-            3: RIGHT * 2.5 + UP * 0.5,
-            4: RIGHT * 2.5 + DOWN * 1.5,
-            5: LEFT * 0.5 + DOWN * 1.5,
-        }
-        cycle_graph = Graph(vertices_cycle, edges_cycle, layout=layout_cycle, vertex_config=vertex_style, edge_config=edge_style)
-        cycle_graph.scale(0.9)
-        cycle_labels = VGroup()
-        for v in vertices_cycle:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(cycle_graph.vertices[v].get_center())
-            cycle_labels.add(label)
-        title_cycle = Text("Cycle", font_size=42).to_edge(UP)
-        desc_cycle = MathTex(
-            r"\text{A closed path. No repeated vertices}", r"\text{ except start/end vertex.}", font_size=28
-        ).next_to(title_cycle, DOWN, buff=0.3)
-        self.play(Create(cycle_graph), Write(title_cycle), run_time=1.5)
-        self.play(Write(cycle_labels), run_time=0.8)
-        self.play(Write(desc_cycle), run_time=1.2)
-        self.wait(1)
-        cycle_sequence = [1, 2, 3, 4, 5, 1]
-        cycle_label = MathTex(
-            r"1 \rightarrow 2 \rightarrow 3 \rightarrow 4 \rightarrow 5 \rightarrow 1", font_size=24
-        ).to_corner(DL)
-        self.play(Write(cycle_label), run_time=1.0)
-        self.wait(1)
-        animate_traversal(cycle_graph, cycle_sequence, color=PURPLE)
-        self.wait(1)
-        start_end_vertex = cycle_graph.vertices[cycle_sequence[0]]
-        self.play(start_end_vertex.animate.set_fill(YELLOW).set_stroke(YELLOW, width=3), run_time=1.0)
-        self.wait(1)
-        self.play(start_end_vertex.animate.set_fill(WHITE).set_stroke(WHITE, width=2), run_time=0.8)
-        self.wait(1)
-        self.play(
-            FadeOut(cycle_graph),
-            FadeOut(cycle_labels),
-            FadeOut(title_cycle),
-            FadeOut(desc_cycle),
-            FadeOut(cycle_label),
-            run_time=0.8,
+        def mark_cycle_start(cycle_graph, sequence):
+            start_end_vertex = cycle_graph.vertices[sequence[0]]
+            start_end_vertex.save_state()
+            return Succession(
+                start_end_vertex.animate(run_time=1.0).set_fill(YELLOW).set_stroke(YELLOW, width=3),
+                Wait(1),
+                Restore(start_end_vertex, run_time=0.8),
+                Wait(1),
+            )
+
+        show_traversal_section(
+            [1, 2, 3, 4, 5],
+            [(1, 2), (2, 3), (3, 4), (4, 5), (5, 1), (1, 3), (2, 4)],
+            {
+                1: LEFT * 2.5 + UP * 1.5,
+                2: RIGHT * 0.5 + UP * 1.8,
+                3: RIGHT * 2.5 + UP * 0.5,
+                4: RIGHT * 2.5 + DOWN * 1.5,
+                5: LEFT * 0.5 + DOWN * 1.5,
+            },
+            "Cycle",
+            (r"\text{A closed path. No repeated vertices}", r"\text{ except start/end vertex.}"),
+            [1, 2, 3, 4, 5, 1],
+            PURPLE,
+            scale=0.9,
+            after_traversal=mark_cycle_start,
+            fade_time=0.8,
+            end_wait=0.5,
         )
-        self.wait(0.5)
 
         # =========================================
         # PART 1: RANDOM GRAPH → COMPLETE GRAPH
@@ -486,33 +607,30 @@ class GraphSequence(Scene):
         n = 7
         vertices = list(range(n))
 
-        # Base: cycle graph + a few chords
-        cycle_edges = [(i, (i + 1) % n) for i in range(n)]
-        all_pairs = list(itertools.combinations(vertices, 2))
-        remaining_pairs = [
-            e for e in all_pairs
-            if e not in cycle_edges and (e[1], e[0]) not in cycle_edges
-        ]
-        extra_edges = [e for e in remaining_pairs if random.random() < 0.2]
-        random_edges = cycle_edges + extra_edges
+        left_part = ["A_1", "A_2", "A_3"]
+        right_part = ["B_1", "B_2", "B_3", "B_4"]
+
+        # Base: cycle graph + a few chords (seeded for reproducible graphs)
+        all_pairs, random_edges, all_bi_pairs, bi_edges = map(
+            list, _random_topology(n, tuple(left_part), tuple(right_part), seed=1)
+        )
 
         graph = Graph(
             vertices,
             random_edges,
             layout="circular",
-            vertex_config=vertex_style,
+            vertex_mobjects=vertex_mobjects(vertices),
             edge_config=edge_style,
         )
         graph.scale(1.3)
         
         graph_labels = VGroup()
         for v in vertices:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(graph.vertices[v].get_center())
+            label = digit_label(v, graph.vertices[v].get_center())
             graph_labels.add(label)
 
-        title = Text("Random Graph", font_size=40).to_edge(UP)
-        self.play(Create(graph), Write(title), run_time=1.5)
+        title = _title("Random Graph", 40).copy().to_edge(UP)
+        self.play(FadeIn(graph, shift=0.2 * UP), Write(title), run_time=1.5)
         self.play(Write(graph_labels), run_time=0.8)
         self.wait(1.0)
 
@@ -528,21 +646,18 @@ class GraphSequence(Scene):
 
         # --- Transform to complete graph ---
         complete_edges = all_pairs
-        new_edges = [e for e in complete_edges if e not in random_edges]
+        new_edges = complement_edges(n, random_edges)
 
         _ = smooth_add_edges(
             graph, new_edges, edge_width,
             color=BLUE, lag_ratio=0.12, run_time=5.0
         )
 
+        E, V = graph.edges, graph.vertices
+
         # Recolor all edges to uniform white
-        self.play(
-            *[
-                edge.animate.set_stroke(WHITE, width=edge_width)
-                for edge in graph.edges.values()
-            ],
-            run_time=3.0
-        )
+        edges_group = VGroup(*E.values())
+        self.play(edges_group.animate.set_stroke(WHITE, width=edge_width), run_time=3.0)
 
         num_edges_complete = len(complete_edges)
         stats_complete = MathTex(
@@ -552,7 +667,7 @@ class GraphSequence(Scene):
             font_size=36
         ).to_corner(DL)
 
-        title_complete = Text("Complete Graph", font_size=40).to_edge(UP)
+        title_complete = _title("Complete Graph", 40).copy().to_edge(UP)
         self.play(
             Transform(title, title_complete),
             Transform(stats, stats_complete),
@@ -561,14 +676,18 @@ class GraphSequence(Scene):
 
         # Highlight one vertex's degree (n−1)
         highlight_vertex = 0
-        incident_edges = [e for e in complete_edges if highlight_vertex in e]
+        incidence = defaultdict(list)
+        for e in complete_edges:
+            incidence[e[0]].append(e)
+            incidence[e[1]].append(e)
+        incident_edges = incidence[highlight_vertex]
+        incident_group = VGroup(*[E[e] for e in incident_edges])
+        V[highlight_vertex].save_state()
+        incident_group.save_state()
 
         self.play(
-            graph.vertices[highlight_vertex].animate.set_fill(YELLOW),
-            *[
-                graph.edges[e].animate.set_stroke(RED, width=edge_width + 1)
-                for e in incident_edges
-            ],
+            V[highlight_vertex].animate.set_fill(YELLOW),
+            incident_group.animate.set_stroke(RED, width=edge_width + 1),
             run_time=3.0
         )
 
@@ -582,11 +701,8 @@ class GraphSequence(Scene):
 
         # Restore complete graph style
         self.play(
-            graph.vertices[highlight_vertex].animate.set_fill(WHITE),
-            *[
-                graph.edges[e].animate.set_stroke(WHITE, width=edge_width)
-                for e in incident_edges
-            ],
+            Restore(V[highlight_vertex]),
+            Restore(incident_group),
             run_time=3.0
         )
         self.play(FadeOut(degree_text), run_time=0.8)
@@ -605,8 +721,6 @@ class GraphSequence(Scene):
         )
         self.wait(1.0)
 
-        left_part = ["A_1", "A_2", "A_3"]
-        right_part = ["B_1", "B_2", "B_3", "B_4"]
         vertices_bi = left_part + right_part
 
         layout_bi = {}
@@ -616,27 +730,22 @@ class GraphSequence(Scene):
         for j, v in enumerate(right_part):
             layout_bi[v] = RIGHT * 3 + UP * (y_step * (len(right_part) - 1) / 2 - y_step * j)
 
-        all_bi_pairs = [(u, v) for u in left_part for v in right_part]
-        bi_edges = [e for e in all_bi_pairs if random.random() < 0.45]
-        if not bi_edges:
-            bi_edges.append(all_bi_pairs[0])
-
         bi_graph = Graph(
             vertices_bi,
             bi_edges,
             layout=layout_bi,
-            vertex_config=vertex_style,
+            vertex_mobjects=vertex_mobjects(vertices_bi),
             edge_config=edge_style,
         )
         
         bi_labels = VGroup()
-        for v in vertices_bi:
+        for v, c in zip(vertices_bi, layout_centers(vertices_bi, layout_bi)):
             label = MathTex(v, font_size=18, color=BLACK)
-            label.move_to(bi_graph.vertices[v].get_center())
+            label.move_to(c)
             bi_labels.add(label)
 
-        title_bi = Text("Bipartite Graph", font_size=40).to_edge(UP)
-        self.play(Create(bi_graph), Write(title_bi), run_time=1.5)
+        title_bi = _title("Bipartite Graph", 40).copy().to_edge(UP)
+        self.play(FadeIn(bi_graph, shift=0.2 * UP), Write(title_bi), run_time=1.5)
         self.play(Write(bi_labels), run_time=0.8)
         self.wait(1.0)
 
@@ -658,20 +767,17 @@ class GraphSequence(Scene):
 
         # Complete bipartite
         complete_bi_edges = all_bi_pairs
-        new_edges_bi = [e for e in complete_bi_edges if e not in bi_edges]
+        bi_set = set(bi_edges)
+        new_edges_bi = [e for e in complete_bi_edges if e not in bi_set]
 
         _ = smooth_add_edges(
             bi_graph, new_edges_bi, edge_width,
             color=BLUE, lag_ratio=0.12, run_time=5.0
         )
+        E, V = bi_graph.edges, bi_graph.vertices
 
-        self.play(
-            *[
-                edge.animate.set_stroke(WHITE, width=edge_width)
-                for edge in bi_graph.edges.values()
-            ],
-            run_time=3.0
-        )
+        edges_group_bi = VGroup(*E.values())
+        self.play(edges_group_bi.animate.set_stroke(WHITE, width=edge_width), run_time=3.0)
 
         num_edges_complete_bi = len(complete_bi_edges)
         stats_bi_complete = MathTex(
@@ -683,7 +789,7 @@ class GraphSequence(Scene):
             font_size=34
         ).to_corner(DL)
 
-        title_bi_complete = Text("Complete Bipartite Graph", font_size=40).to_edge(UP)
+        title_bi_complete = _title("Complete Bipartite Graph", 40).copy().to_edge(UP)
         self.play(
             Transform(title_bi, title_bi_complete),
             Transform(stats_bi, stats_bi_complete),
@@ -692,14 +798,18 @@ class GraphSequence(Scene):
 
         # Highlight one node in complete bipartite graph
         highlight_vertex_bi = "A_1"
-        incident_edges_bi = [e for e in complete_bi_edges if highlight_vertex_bi in e]
+        incidence_bi = defaultdict(list)
+        for e in complete_bi_edges:
+            incidence_bi[e[0]].append(e)
+            incidence_bi[e[1]].append(e)
+        incident_edges_bi = incidence_bi[highlight_vertex_bi]
+        incident_group_bi = VGroup(*[E[e] for e in incident_edges_bi])
+        V[highlight_vertex_bi].save_state()
+        incident_group_bi.save_state()
 
         self.play(
-            bi_graph.vertices[highlight_vertex_bi].animate.set_fill(YELLOW),
-            *[
-                bi_graph.edges[e].animate.set_stroke(RED, width=edge_width + 1)
-                for e in incident_edges_bi
-            ],
+            V[highlight_vertex_bi].animate.set_fill(YELLOW),
+            incident_group_bi.animate.set_stroke(RED, width=edge_width + 1),
             run_time=1.5
         )
 
@@ -712,11 +822,8 @@ class GraphSequence(Scene):
         self.wait(1.0)
 
         self.play(
-            bi_graph.vertices[highlight_vertex_bi].animate.set_fill(WHITE),
-            *[
-                bi_graph.edges[e].animate.set_stroke(WHITE, width=edge_width)
-                for e in incident_edges_bi
-            ],
+            Restore(V[highlight_vertex_bi]),
+            Restore(incident_group_bi),
             run_time=3.0
         )
         self.play(FadeOut(degree_bi_text), run_time=0.8)
@@ -742,19 +849,18 @@ class GraphSequence(Scene):
             vertices_c,
             edges_c,
             layout="circular",
-            vertex_config=vertex_style,
+            vertex_mobjects=vertex_mobjects(vertices_c),
             edge_config=edge_style,
         )
         conn_graph.scale(1.3)
         
         conn_labels = VGroup()
         for v in vertices_c:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(conn_graph.vertices[v].get_center())
+            label = digit_label(v, conn_graph.vertices[v].get_center())
             conn_labels.add(label)
 
-        title_conn = Text("Connected Graph", font_size=40).to_edge(UP)
-        self.play(Create(conn_graph), Write(title_conn), run_time=1.5)
+        title_conn = _title("Connected Graph", 40).copy().to_edge(UP)
+        self.play(FadeIn(conn_graph, shift=0.2 * UP), Write(title_conn), run_time=1.5)
         self.play(Write(conn_labels), run_time=0.8)
         self.wait(1.0)
 
@@ -771,7 +877,7 @@ class GraphSequence(Scene):
         bridge_edge = (2, 3)
         bridge_mob = conn_graph.edges[bridge_edge]
 
-        title_disc = Text("Disconnected Graph", font_size=40).to_edge(UP)
+        title_disc = _title("Disconnected Graph", 40).copy().to_edge(UP)
         stats_disc = MathTex(
             rf"n = {len(vertices_c)}",
             r",\quad",
@@ -820,7 +926,7 @@ class GraphSequence(Scene):
             vertices_d,
             dir_edges,
             layout="circular",
-            vertex_config=vertex_style,
+            vertex_mobjects=vertex_mobjects(vertices_d),
             edge_config={
                 "stroke_color": WHITE,
                 "stroke_width": edge_width,
@@ -831,13 +937,18 @@ class GraphSequence(Scene):
         
         digraph_labels = VGroup()
         for v in vertices_d:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(digraph.vertices[v].get_center())
+            label = digit_label(v, digraph.vertices[v].get_center())
             digraph_labels.add(label)
 
-        title_dir = Text("Directed Graph", font_size=40).to_edge(UP)
-        self.play(Create(digraph), Write(title_dir), run_time=1.5)
-        self.play(Write(digraph_labels), run_time=0.8)
+        title_dir = _title("Directed Graph", 40).copy().to_edge(UP)
+        self.play(
+            LaggedStart(
+                AnimationGroup(Create(digraph), Write(title_dir)),
+                Write(digraph_labels),
+                lag_ratio=0.6,
+            ),
+            run_time=2.0,
+        )
         self.wait(1.0)
 
         stats_dir = MathTex(
@@ -863,22 +974,11 @@ class GraphSequence(Scene):
             color=BLUE,
             lag_ratio=0.12,
             run_time=4.0,
+            edge_type=Arrow,
         )
 
-        # Ensure arrowhead is visible on the new edge explicitly
-        for e in new_dir_edges:
-            edge = digraph.edges[e]
-            if hasattr(edge, "add_tip"):
-                edge.add_tip()
-
         # Unify style (all arrows white and same width)
-        self.play(
-            *[
-                edge.animate.set_stroke(WHITE, width=edge_width)
-                for edge in digraph.edges.values()
-            ],
-            run_time=3.0
-        )
+        self.play(VGroup(*digraph.edges.values()).animate.set_stroke(WHITE, width=edge_width), run_time=3.0)
 
         stats_dir_sc = MathTex(
             rf"n = {len(vertices_d)}",
@@ -889,7 +989,7 @@ class GraphSequence(Scene):
             font_size=32
         ).to_corner(DL)
 
-        title_dir_sc = Text("Strongly Connected Directed Graph", font_size=34).to_edge(UP)
+        title_dir_sc = _title("Strongly Connected Directed Graph", 34).copy().to_edge(UP)
 
         self.play(
             Transform(title_dir, title_dir_sc),
@@ -923,16 +1023,7 @@ class GraphSequence(Scene):
         # =========================================
         # REGULAR GRAPH (k-regular)
         # =========================================
-        vertices_reg = list(range(6))
-        edges_reg = [
-            (0, 1), (0, 2), (0, 5),
-            (1, 2), (1, 3),
-            (2, 3),
-            (3, 4),
-            (4, 5),
-            (5, 2)
-        ]  # mixture forming roughly 3-regular except slight variance; adjust to 3-regular below
-        # Adjust to true 3-regular on 6 nodes: use prism graph edges
+        # True 3-regular graph on 6 nodes: the triangular prism
         vertices_reg = list(range(6))
         edges_reg = [
             (0,1),(1,2),(2,0),  # top triangle
@@ -951,20 +1042,24 @@ class GraphSequence(Scene):
             vertices_reg,
             edges_reg,
             layout=layout_reg,
-            vertex_config=vertex_style,
+            vertex_mobjects=vertex_mobjects(vertices_reg),
             edge_config=edge_style,
         )
+        about_reg = reg_graph.get_center()
         reg_graph.scale(1.1)
+        reg_centers = dict(zip(vertices_reg, layout_centers(vertices_reg, layout_reg, 1.1, about_reg)))
         
-        reg_labels = VGroup()
-        for v in vertices_reg:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(reg_graph.vertices[v].get_center())
-            reg_labels.add(label)
+        reg_labels = VGroup(*[digit_label(v, reg_centers[v]) for v in vertices_reg])
         
-        title_reg = Text("Regular Graph (3-regular)", font_size=40).to_edge(UP)
-        self.play(Create(reg_graph), Write(title_reg), run_time=1.5)
-        self.play(Write(reg_labels), run_time=0.8)
+        title_reg = _title("Regular Graph (3-regular)", 40).copy().to_edge(UP)
+        self.play(
+            LaggedStart(
+                AnimationGroup(Create(reg_graph), Write(title_reg)),
+                Write(reg_labels),
+                lag_ratio=0.6,
+            ),
+            run_time=2.0,
+        )
         self.wait(1.0)
 
         # Show degrees (all should be 3)
@@ -981,7 +1076,7 @@ class GraphSequence(Scene):
         }
         for v in vertices_reg:
             lbl = MathTex(rf"\deg({v}) = 3", font_size=20, color=GREEN)
-            lbl.move_to(reg_graph.vertices[v].get_center() + label_positions.get(v, UP * 0.5))
+            lbl.move_to(reg_centers[v] + label_positions.get(v, UP * 0.5))
             deg_labels_reg.add(lbl)
         self.play(Write(deg_labels_reg), run_time=1.2)
         self.wait(1.0)
@@ -1025,18 +1120,20 @@ class GraphSequence(Scene):
             vertices_m,
             edges_m,
             layout=layout_m,
-            vertex_config=vertex_style,
+            vertex_mobjects=vertex_mobjects(vertices_m),
             edge_config=edge_style,
         )
+        about_m = matrix_graph.get_center()
         matrix_graph.scale(1.1)
+        matrix_centers = dict(zip(vertices_m, layout_centers(vertices_m, layout_m, 1.1, about_m)))
 
-        title_mat = Text("Incidence Matrix", font_size=36).to_edge(UP)
+        title_mat = _title("Incidence Matrix", 36).copy().to_edge(UP)
         
         # Add node labels to the graph
         node_labels_matrix = VGroup()
         for v in vertices_m:
-            label = MathTex(f"v_{v}", font_size=24, color=BLACK)
-            label.move_to(matrix_graph.vertices[v].get_center())
+            label = mathtex_proto(f"v_{v}", 24, BLACK).copy()
+            label.move_to(matrix_centers[v])
             node_labels_matrix.add(label)
         
         # Add edge labels to the graph (e1, e2, etc.)
@@ -1046,7 +1143,7 @@ class GraphSequence(Scene):
             edge_mob = matrix_graph.edges[e]
             midpoint = edge_mob.get_center()
             # Position label slightly offset from the edge
-            label = MathTex(f"e_{j+1}", font_size=20, color=YELLOW)
+            label = mathtex_proto(f"e_{j+1}", 20, YELLOW).copy()
             # Position label perpendicular to edge, slightly away
             if e == (1, 2):
                 label.move_to(midpoint + UP * 0.3)
@@ -1060,9 +1157,15 @@ class GraphSequence(Scene):
                 label.move_to(midpoint + DOWN * 0.2 + LEFT * 0.2)
             edge_labels_matrix.add(label)
         
-        self.play(Create(matrix_graph), Write(title_mat), run_time=1.5)
-        self.play(Write(node_labels_matrix), run_time=1.0)
-        self.play(Write(edge_labels_matrix), run_time=1.0)
+        self.play(
+            LaggedStart(
+                AnimationGroup(Create(matrix_graph), Write(title_mat)),
+                Write(node_labels_matrix),
+                Write(edge_labels_matrix),
+                lag_ratio=0.5,
+            ),
+            run_time=2.5,
+        )
         self.wait(1.0)
 
         # -----------------------------------------
@@ -1070,26 +1173,21 @@ class GraphSequence(Scene):
         # -----------------------------------------
 
         # Build incidence matrix: rows = vertices, cols = edges
-        incidence_data = []
-        for v in vertices_m:
-            row = []
-            for e in edges_m:
-                row.append(1 if v in e else 0)
-            incidence_data.append(row)
+        incidence_data = incidence_matrix(vertices_m, edges_m).tolist()
 
         # Slightly larger matrix
         inc_matrix = IntegerMatrix(
             incidence_data,
-            h_buff=0.6,
-            v_buff=0.6,
+            h_buff=0.66,
+            v_buff=0.66,
+            element_to_mobject_config={"font_size": DEFAULT_FONT_SIZE * 1.1},
         )
-        inc_matrix.scale(1.1)
         inc_matrix.next_to(matrix_graph, RIGHT, buff=1.5)
 
         # Row labels: vertices (Y-axis) with extra shift to avoid '[' overlap
         row_labels_inc = VGroup()
         for i, v in enumerate(vertices_m):
-            lbl = MathTex(f"v_{v}", font_size=32)
+            lbl = mathtex_proto(f"v_{v}", 32).copy()
             lbl.next_to(inc_matrix.get_rows()[i], LEFT, buff=0.45)
             lbl.shift(LEFT * 0.35)  # extra push to clear the bracket
             row_labels_inc.add(lbl)
@@ -1097,7 +1195,7 @@ class GraphSequence(Scene):
         # Column labels: edges e_1,... (X-axis) – short, to avoid clutter
         col_labels_inc = VGroup()
         for j, e in enumerate(edges_m):
-            lbl = MathTex(rf"e_{j+1}", font_size=30)
+            lbl = mathtex_proto(f"e_{j+1}", 30).copy()
             lbl.next_to(inc_matrix.get_columns()[j], UP, buff=0.35)
             col_labels_inc.add(lbl)
 
@@ -1128,22 +1226,16 @@ class GraphSequence(Scene):
         self.wait(1.0)
 
         # Map entries (i,j) → mobjects for highlighting
-        inc_entries = []
-        entries_group = inc_matrix.get_entries()
         num_rows_inc = len(vertices_m)
         num_cols_inc = len(edges_m)
-        for i in range(num_rows_inc):
-            row_entries = []
-            for j in range(num_cols_inc):
-                idx = i * num_cols_inc + j
-                row_entries.append(entries_group[idx])
-            inc_entries.append(row_entries)
+        inc_entries = _entry_grid(inc_matrix, num_rows_inc, num_cols_inc)
 
         # Highlight each 1 in the incidence matrix with:
         # - the vertex
         # - the edge
         # - the row label (vertex label, Y-axis)
         # - the column label (edge label, X-axis)
+        highlight_anims = []
         for i, v in enumerate(vertices_m):
             for j, e in enumerate(edges_m):
                 if incidence_data[i][j] == 1:
@@ -1153,34 +1245,34 @@ class GraphSequence(Scene):
                     row_label = row_labels_inc[i]
                     col_label = col_labels_inc[j]
 
-                    # Find corresponding edge label
-                    edge_label_idx = edges_m.index(e)
-                    edge_label_mob = edge_labels_matrix[edge_label_idx] if edge_label_idx < len(edge_labels_matrix) else None
+                    # Edge labels are in column order, so column j is edge e's label
+                    edge_label_mob = edge_labels_matrix[j]
                     
-                    anims = [
+                    # Build the highlight before creating the reset builders: both
+                    # target the same mobjects, and AnimationGroup builds on construction
+                    highlight = AnimationGroup(
                         cell.animate.set_color(RED),
                         row_label.animate.set_color(RED),
                         col_label.animate.set_color(RED),
                         vertex_mob.animate.set_fill(RED),
                         edge_mob.animate.set_stroke(RED, width=edge_width + 1),
-                    ]
-                    if edge_label_mob:
-                        anims.append(edge_label_mob.animate.set_color(RED))
-                    
-                    self.play(*anims, run_time=1.2)
-                    
-                    anims_reset = [
+                        edge_label_mob.animate.set_color(RED),
+                        run_time=1.2,
+                    )
+                    reset = AnimationGroup(
                         cell.animate.set_color(WHITE),
                         row_label.animate.set_color(WHITE),
                         col_label.animate.set_color(WHITE),
                         vertex_mob.animate.set_fill(WHITE),
                         edge_mob.animate.set_stroke(WHITE, width=edge_width),
-                    ]
-                    if edge_label_mob:
-                        anims_reset.append(edge_label_mob.animate.set_color(YELLOW))
-                    
-                    self.play(*anims_reset, run_time=0.8)
+                        edge_label_mob.animate.set_color(YELLOW),
+                        run_time=0.8,
+                    )
+                    highlight_anims += [highlight, reset]
 
+        # Cells share row/column labels and vertices, so each highlight and reset
+        # must begin only after the previous one ends; Succession guarantees that
+        self.play(Succession(*highlight_anims))
         self.wait(1.0)
 
         # -----------------------------------------
@@ -1188,7 +1280,7 @@ class GraphSequence(Scene):
         # -----------------------------------------
 
         # Fade out incidence matrix and labels, change title to Adjacency Matrix
-        title_adj = Text("Adjacency Matrix", font_size=36).to_edge(UP)
+        title_adj = _title("Adjacency Matrix", 36).copy().to_edge(UP)
         self.play(
             FadeOut(inc_matrix),
             FadeOut(row_labels_inc),
@@ -1204,27 +1296,15 @@ class GraphSequence(Scene):
 
         # Build adjacency matrix A(G)
         n_m = len(vertices_m)
-        adjacency_data = []
-        # helper to check edge presence (undirected)
-        existing_edges = set((min(u, v), max(u, v)) for (u, v) in edges_m)
-
-        for i, u in enumerate(vertices_m):
-            row = []
-            for j, v in enumerate(vertices_m):
-                if i == j:
-                    row.append(0)  # no loops
-                else:
-                    key = (min(u, v), max(u, v))
-                    row.append(1 if key in existing_edges else 0)
-            adjacency_data.append(row)
+        adjacency_data = adjacency_matrix(vertices_m, edges_m).tolist()
 
         # Slightly larger adjacency matrix
         adj_matrix = IntegerMatrix(
             adjacency_data,
-            h_buff=0.6,
-            v_buff=0.6,
+            h_buff=0.66,
+            v_buff=0.66,
+            element_to_mobject_config={"font_size": DEFAULT_FONT_SIZE * 1.1},
         )
-        adj_matrix.scale(1.1)
         adj_matrix.next_to(matrix_graph, RIGHT, buff=1.5)
 
         # Row & column labels: vertices (X and Y axes)
@@ -1232,13 +1312,13 @@ class GraphSequence(Scene):
         col_labels_adj = VGroup()
 
         for i, v in enumerate(vertices_m):
-            r_lbl = MathTex(f"v_{v}", font_size=32)
+            r_lbl = mathtex_proto(f"v_{v}", 32).copy()
             r_lbl.next_to(adj_matrix.get_rows()[i], LEFT, buff=0.45)
             r_lbl.shift(LEFT * 0.35)  # avoid '[' overlap
             row_labels_adj.add(r_lbl)
 
         for j, v in enumerate(vertices_m):
-            c_lbl = MathTex(f"v_{v}", font_size=32)
+            c_lbl = mathtex_proto(f"v_{v}", 32).copy()
             c_lbl.next_to(adj_matrix.get_columns()[j], UP, buff=0.35)
             col_labels_adj.add(c_lbl)
 
@@ -1266,16 +1346,7 @@ class GraphSequence(Scene):
         self.play(Write(adj_explanation), run_time=3.0)
 
         # Map adjacency entries for highlighting
-        adj_entries = []
-        entries_group_adj = adj_matrix.get_entries()
-        num_rows_adj = n_m
-        num_cols_adj = n_m
-        for i in range(num_rows_adj):
-            row_entries = []
-            for j in range(num_cols_adj):
-                idx = i * num_cols_adj + j
-                row_entries.append(entries_group_adj[idx])
-            adj_entries.append(row_entries)
+        adj_entries = _entry_grid(adj_matrix, n_m, n_m)
 
         # Highlight each 1 = edge between v_i and v_j, with:
         # - cell A_ij
@@ -1283,52 +1354,55 @@ class GraphSequence(Scene):
         # - column label (v_j)
         # - both vertices in the graph
         # - corresponding edge in the graph
+        # Look edges up by either orientation so the loop needs no min/max
+        edge_lookup = {}
+        for (a, b), edge_mob in matrix_graph.edges.items():
+            edge_lookup[(a, b)] = edge_lookup[(b, a)] = edge_mob
+        vertex_lookup = dict(matrix_graph.vertices)
+
+        highlight_anims = []
         for i, u in enumerate(vertices_m):
             for j, v in enumerate(vertices_m):
                 if adjacency_data[i][j] == 1:
                     cell = adj_entries[i][j]
 
-                    key = (min(u, v), max(u, v))
-                    edge_mob = matrix_graph.edges[key]
-                    vertex_u = matrix_graph.vertices[u]
-                    vertex_v = matrix_graph.vertices[v]
+                    edge_mob = edge_lookup[(u, v)]
+                    vertex_u = vertex_lookup[u]
+                    vertex_v = vertex_lookup[v]
                     row_label = row_labels_adj[i]
                     col_label = col_labels_adj[j]
 
-                    # Find corresponding node labels
-                    node_label_u = node_labels_matrix[vertices_m.index(u)] if u in vertices_m else None
-                    node_label_v = node_labels_matrix[vertices_m.index(v)] if v in vertices_m else None
+                    # Node labels follow vertices_m, so rows/columns index them directly
+                    node_label_u = node_labels_matrix[i]
+                    node_label_v = node_labels_matrix[j]
                     
-                    anims = [
+                    # Build the highlight before creating the reset builders: both
+                    # target the same mobjects, and AnimationGroup builds on construction
+                    highlight = AnimationGroup(
                         cell.animate.set_color(RED),
                         row_label.animate.set_color(RED),
                         col_label.animate.set_color(RED),
                         vertex_u.animate.set_fill(RED),
                         vertex_v.animate.set_fill(RED),
                         edge_mob.animate.set_stroke(RED, width=edge_width + 1),
-                    ]
-                    if node_label_u:
-                        anims.append(node_label_u.animate.set_color(RED))
-                    if node_label_v:
-                        anims.append(node_label_v.animate.set_color(RED))
-                    
-                    self.play(*anims, run_time=1.2)
-                    
-                    anims_reset = [
+                        node_label_u.animate.set_color(RED),
+                        node_label_v.animate.set_color(RED),
+                        run_time=1.2,
+                    )
+                    reset = AnimationGroup(
                         cell.animate.set_color(WHITE),
                         row_label.animate.set_color(WHITE),
                         col_label.animate.set_color(WHITE),
                         vertex_u.animate.set_fill(WHITE),
                         vertex_v.animate.set_fill(WHITE),
                         edge_mob.animate.set_stroke(WHITE, width=edge_width),
-                    ]
-                    if node_label_u:
-                        anims_reset.append(node_label_u.animate.set_color(BLACK))
-                    if node_label_v:
-                        anims_reset.append(node_label_v.animate.set_color(BLACK))
-                    
-                    self.play(*anims_reset, run_time=0.8)
+                        node_label_u.animate.set_color(BLACK),
+                        node_label_v.animate.set_color(BLACK),
+                        run_time=0.8,
+                    )
+                    highlight_anims += [highlight, reset]
 
+        self.play(Succession(*highlight_anims))
         self.wait(1.0)
         
         # ============================================================
@@ -1346,18 +1420,14 @@ class GraphSequence(Scene):
         self.wait(1)
         
         # Show edge list and adjacency list for the current graph (matrix_graph)
-        list_title = Text("Edge List & Adjacency List", font_size=36).to_edge(UP)
+        list_title = _title("Edge List & Adjacency List", 36).copy().to_edge(UP)
         self.play(Transform(title_mat, list_title), run_time=1.2)
         self.wait(1)
         
         # Update node labels to show numbers instead of v_1, v_2, etc.
         # Remove old labels and add new ones
         self.play(FadeOut(node_labels_matrix), run_time=0.5)
-        node_labels = VGroup()
-        for v in vertices_m:
-            label = MathTex(str(v), font_size=20, color=BLACK)
-            label.move_to(matrix_graph.vertices[v].get_center())
-            node_labels.add(label)
+        node_labels = VGroup(*[digit_label(v, matrix_centers[v]) for v in vertices_m])
         self.play(Write(node_labels), run_time=1.5)
         self.wait(1)
 
@@ -1372,12 +1442,7 @@ class GraphSequence(Scene):
         self.play(Write(edge_list_tex), run_time=1.5)
 
         # Build adjacency list from edges_m
-        adj_list = {v: [] for v in vertices_m}
-        for (u, v) in edges_m:
-            adj_list[u].append(v)
-            adj_list[v].append(u)
-        for v in adj_list:
-            adj_list[v] = sorted(adj_list[v])
+        adj_list = adjacency_lists(vertices_m, edges_m)
 
         adj_list_rows = VGroup()
         for i, v in enumerate(vertices_m):
@@ -1406,25 +1471,21 @@ class GraphSequence(Scene):
             e for e in edges_m if (e[0] in sub_vertices and e[1] in sub_vertices)
         ]
 
+        sub_vertex_group = VGroup(*[matrix_graph.vertices[v] for v in sub_vertices])
+        other_vertex_group = VGroup(*[matrix_graph.vertices[v] for v in vertices_m if v not in sub_vertices])
+        sub_edge_group = VGroup(*[matrix_graph.edges[e] for e in sub_edges])
+
         # Dim non-subgraph vertices slightly
         self.play(
-            *[
-                matrix_graph.vertices[v].animate.set_fill(GRAY if v not in sub_vertices else WHITE)
-                for v in vertices_m
-            ],
+            other_vertex_group.animate.set_fill(GRAY),
+            sub_vertex_group.animate.set_fill(WHITE),
             run_time=1.0,
         )
 
         # Emphasize subgraph vertices and edges
         self.play(
-            *[
-                matrix_graph.vertices[v].animate.set_fill(YELLOW)
-                for v in sub_vertices
-            ],
-            *[
-                matrix_graph.edges[e].animate.set_stroke(GREEN, width=edge_width + 1)
-                for e in sub_edges
-            ],
+            sub_vertex_group.animate.set_fill(YELLOW),
+            sub_edge_group.animate.set_stroke(GREEN, width=edge_width + 1),
             run_time=1.5,
         )
         subgraph_label = MathTex(
@@ -0,0 +1,17 @@
+"""
+TeX Label Cache
+
+Shared cache for the small MathTex labels the scenes place over and over
+(vertex numbers, v_i / e_j tags, theorem lines). Each (tex, font_size, color)
+is typeset once; callers take a .copy() before positioning it.
+"""
+
+from functools import lru_cache
+
+from manim import WHITE, MathTex
+
+
+@lru_cache(maxsize=256)
+def mathtex_proto(tex, font_size, color=WHITE):
+    """Build a MathTex once per (tex, font_size, color); callers take a .copy()."""
+    return MathTex(tex, font_size=font_size, color=color)
@@ -0,0 +1,120 @@
+"""
+Render a long Manim scene in parallel and stitch the parts together.
+
+The scene is first run as a dry run to count its ``self.play``/``self.wait``
+calls. That animation range is split into one contiguous slice per worker,
+each slice is rendered by its own ``manim -n start,end`` process, and the
+resulting clips are joined losslessly with ``ffmpeg -f concat``.
+
+Usage:
+    python tools/render_parallel.py src/hamiltonian_path.py HamiltonConcepts -q m
+    python tools/render_parallel.py src/main.py GraphSequence -q h -j 4
+
+Requires ``manim`` and ``ffmpeg`` on the PATH.
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from multiprocessing import Pool
+
+
+def count_animations(scene_file, scene_name):
+    """Return the number of animations (plays and waits) the scene performs."""
+    from manim import tempconfig
+
+    spec = importlib.util.spec_from_file_location("_scene_module", scene_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(scene_file)))
+    spec.loader.exec_module(module)
+
+    with tempconfig({"dry_run": True, "quality": "low_quality"}):
+        scene = getattr(module, scene_name)()
+        scene.render()
+        return scene.renderer.num_plays
+
+
+def split_ranges(total, parts):
+    """Split animations 0..total-1 into contiguous inclusive (start, end) ranges."""
+    parts = max(1, min(parts, total))
+    size, extra = divmod(total, parts)
+    ranges, start = [], 0
+    for k in range(parts):
+        end = start + size + (1 if k < extra else 0) - 1
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def render_part(job):
+    """Render one animation range into its own media directory; return the clip path."""
+    index, (start, end), scene_file, scene_name, quality, work_dir = job
+    media_dir = os.path.join(work_dir, f"part_{index}")
+    subprocess.run(
+        [
+            "manim",
+            f"-q{quality}",
+            "--disable_caching",
+            "--media_dir", media_dir,
+            "-n", f"{start},{end}",
+            "-o", f"part_{index}",
+            scene_file,
+            scene_name,
+        ],
+        check=True,
+    )
+    clips = glob.glob(os.path.join(media_dir, "videos", "**", f"part_{index}.mp4"), recursive=True)
+    if not clips:
+        raise FileNotFoundError(f"No output clip found for part {index} in {media_dir}")
+    return clips[0]
+
+
+def concat_clips(clips, output):
+    """Join the rendered clips in order without re-encoding."""
+    list_file = os.path.join(os.path.dirname(clips[0]), "concat.txt")
+    with open(list_file, "w") as f:
+        for clip in clips:
+            f.write(f"file '{os.path.abspath(clip)}'\n")
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", list_file, "-c", "copy", output],
+        check=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-q", "--quality", default="m", choices=list("lmhpk"))
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+
+    total = count_animations(args.scene_file, args.scene_name)
+    ranges = split_ranges(total, args.jobs)
+    print(f"{args.scene_name}: {total} animations across {len(ranges)} workers")
+
+    work_dir = tempfile.mkdtemp(prefix="manim_parallel_")
+    try:
+        jobs = [
+            (k, r, args.scene_file, args.scene_name, args.quality, work_dir)
+            for k, r in enumerate(ranges)
+        ]
+        with Pool(len(jobs)) as pool:
+            clips = pool.map(render_part, jobs)
+
+        output = args.output or f"{args.scene_name}.mp4"
+        concat_clips(clips, output)
+        print(f"Wrote {output}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()